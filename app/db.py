@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
 from contextlib import contextmanager
-from typing import Iterator
+from functools import lru_cache
+from typing import Any, Iterator
 
+import orjson
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
 from psycopg2.extensions import connection as Conn
 
+# Decode json/jsonb columns with orjson instead of the stdlib json module.
+psycopg2.extras.register_default_json(globally=True, loads=orjson.loads)
+psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
 
 def _db_config() -> dict:
     return {
@@ -20,10 +30,86 @@ def _db_config() -> dict:
     }
 
 
+class _Conn(Conn):
+    """Connection that remembers which statements are PREPAREd on its session."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
+
+# Process-wide pool, created lazily so each forked worker builds its own.
+# Checkouts are not validated with a probe query: a connection that died while
+# idle fails its first statement, callers already degrade per sub-block, and it
+# is discarded on release.
+_POOL_MIN = int(os.getenv("PGPOOL_MIN", "2"))
+POOL_MAX = int(os.getenv("PGPOOL_MAX", "10"))
+_pool: psycopg2.pool.ThreadedConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    _POOL_MIN, POOL_MAX, connection_factory=_Conn, **_db_config()
+                )
+    return _pool
+
+
 @contextmanager
 def get_conn() -> Iterator[Conn]:
-    conn = psycopg2.connect(**_db_config())
+    """Yield a pooled connection (a dedicated one if the pool is exhausted).
+
+    Like a fresh connection, nothing is committed implicitly: on release any
+    open transaction is rolled back and per-request session options reset.
+    """
+    pool = _get_pool()
+    try:
+        conn = pool.getconn()
+    except psycopg2.pool.PoolError:
+        conn = psycopg2.connect(connection_factory=_Conn, **_db_config())
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
     try:
         yield conn
     finally:
-        conn.close()
+        discard = bool(conn.closed)
+        if not discard:
+            try:
+                conn.rollback()  # no round trip when no transaction is open
+                conn.set_session(isolation_level="DEFAULT", readonly="DEFAULT", autocommit=False)
+            except Exception:
+                discard = True
+        pool.putconn(conn, close=discard)
+
+
+@lru_cache(maxsize=256)
+def _statement_name(sql: str) -> str:
+    return "stmt_" + hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+
+
+def execute_prepared(cur: Any, sql: str) -> None:
+    """Execute the parameterless *sql* as a server-side prepared statement.
+
+    The statement is PREPAREd the first time a session runs it and EXECUTEd
+    afterwards, so Postgres parses and plans it once per pooled connection.
+    Its name is derived from the SQL text, so call sites need no registry.
+    Prepared statements are not transactional: they survive the rollback on
+    release and live as long as the connection.
+    """
+    prepared = getattr(cur.connection, "prepared", None)
+    if prepared is None:  # connection not created by get_conn()
+        cur.execute(sql)
+        return
+    name = _statement_name(sql)
+    if name not in prepared:
+        cur.execute(f"PREPARE {name} AS {sql}")
+        prepared.add(name)
+    cur.execute(f"EXECUTE {name}")
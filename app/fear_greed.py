@@ -10,7 +10,7 @@ import httpx
 from psycopg2.extras import Json
 
 from .db import get_conn
-from .snapshots import get_snapshot
+from .snapshots import get_snapshot, invalidate_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +67,7 @@ def _upsert_dataset(payload: Dict[str, Any]) -> None:
                 (DATASET_KEY, Json(payload)),
             )
         conn.commit()
+    invalidate_snapshot(DATASET_KEY)
 
 
 def get_fear_greed(max_age_seconds: int = 300) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
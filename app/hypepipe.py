@@ -72,6 +72,8 @@ from .snapshots import (
     fmt_pct,
     fmt_usd,
     get_snapshot,
+    get_snapshots,
+    snapshot_payload,
 )
 
 logger = logging.getLogger(__name__)
@@ -384,14 +386,19 @@ def _dispatch_macro_pillars_status(input_data: Dict[str, Any]) -> Dict[str, Any]
     Five pillars: rates, usd, liquidity, risk, crypto.
     Returns "unknown" for pillars without a live data source (rates, usd).
     """
-    # Fetch available snapshots
-    price_snap = get_snapshot("coingecko:price_simple:usd:bitcoin")
-    funding_snap = get_snapshot("coinglass:oi_weighted_funding:BTC")
-    liq_snap = get_snapshot("coinglass:liquidations:BTC")
-
-    price, chg24 = extract_price(price_snap["payload"]) if price_snap else (None, None)
-    funding_pct = extract_funding(funding_snap["payload"]) if funding_snap else None
-    liq = extract_liquidations(liq_snap["payload"]) if liq_snap else {}
+    # Fetch available snapshots (one round-trip)
+    snaps = get_snapshots((
+        "coingecko:price_simple:usd:bitcoin",
+        "coinglass:oi_weighted_funding:BTC",
+        "coinglass:liquidations:BTC",
+    ))
+    price_snap = snaps.get("coingecko:price_simple:usd:bitcoin")
+    funding_snap = snaps.get("coinglass:oi_weighted_funding:BTC")
+    liq_snap = snaps.get("coinglass:liquidations:BTC")
+
+    price, chg24 = extract_price(snapshot_payload(price_snap))
+    funding_pct = extract_funding(snapshot_payload(funding_snap))
+    liq = extract_liquidations(snapshot_payload(liq_snap))
     liq_total = liq.get("total_usd")
     liq_long_pct = liq.get("long_pct")
 
@@ -686,8 +693,9 @@ def _dispatch_pm_markets_movers(input_data: Dict[str, Any]) -> Dict[str, Any]:
     items: List[Dict[str, Any]] = []
     data_found = False
 
+    snaps = get_snapshots(_PM_SNAPSHOT_KEYS)
     for key in _PM_SNAPSHOT_KEYS:
-        snap = get_snapshot(key)
+        snap = snaps.get(key)
         if not snap:
             continue
         data_found = True
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
-from datetime import datetime, timezone
+import logging
+import re
 from typing import Any, Dict
 
+import orjson
 from fastapi import FastAPI, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from .fear_greed import get_fear_greed
 from .paper import build_paper_summary
@@ -19,6 +23,7 @@ from .health_services import (
     HEARTBEAT_INGEST_SECRET,
     _ALLOWED_SERVICES,
 )
+from .telemetry_common import now_iso
 from .telemetry_overview import build_telemetry_overview
 from .telemetry_summary import build_telemetry_summary
 from .telemetry_users import build_telemetry_users
@@ -61,7 +66,8 @@ from .snapshots import (
     extract_price,
     fmt_pct,
     fmt_usd,
-    get_snapshot,
+    get_snapshots,
+    snapshot_payload,
 )
 from .hypepipe import router as hypepipe_router
 from .relevance import (
@@ -108,14 +114,12 @@ from .strategy_templates import (
     build_template_recommendations,
 )
 
-
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+logger = logging.getLogger(__name__)
 
 
 def etag_for(obj: Any) -> str:
     raw = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 def json_with_cache(payload: Dict[str, Any], cache_control: str) -> JSONResponse:
@@ -129,16 +133,159 @@ def json_with_cache(payload: Dict[str, Any], cache_control: str) -> JSONResponse
     )
 
 
+def json_bytes_with_cache(body: bytes, cache_control: str) -> Response:
+    """Like json_with_cache, for bodies that are already JSON-encoded."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "Cache-Control": cache_control,
+            "ETag": hashlib.blake2b(body, digest_size=16).hexdigest(),
+        },
+    )
+
+
+def orjson_with_cache(payload: Dict[str, Any], cache_control: str) -> Response:
+    """Like json_with_cache, encoding once with orjson (datetimes serialized natively)."""
+    return json_bytes_with_cache(orjson.dumps(payload), cache_control)
+
+
+def _json_tail(obj: Dict[str, Any]) -> bytes:
+    """Encode obj's members as they appear after the opening '{' (JSONResponse format)."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")[1:]
+
+
+# ---- Static response fragments, encoded once at import ----
+# Only ts (and symbol for the supercard) vary, so they are spliced in as bytes.
+
+_HEALTH_PREFIX = b'{"ok":true,"service":"eventedge-api","api":"v1","ts":"'
+_HEALTH_SUFFIX = b'"}'
+
+_SUPERCARD_FALLBACK_TAIL = _json_tail({
+    "version": "v0.1-placeholder",
+    "summary": {"headline": "—", "stance": "—", "confidence": "—", "notes": ["—", "—", "—"]},
+    "pillars": [
+        {"key": "flow", "label": "Flow", "value": "—", "status": "neutral", "hint": "pressure proxy"},
+        {"key": "leverage", "label": "Leverage", "value": "—", "status": "neutral", "hint": "OI + funding stress"},
+        {"key": "fragility", "label": "Fragility", "value": "—", "status": "neutral", "hint": "liq imbalance + spikes"},
+        {"key": "momentum", "label": "Momentum", "value": "—", "status": "neutral", "hint": "trend + volatility"},
+        {"key": "sentiment", "label": "Sentiment", "value": "—", "status": "neutral", "hint": "fear/greed"},
+        {"key": "risk", "label": "Risk", "value": "—", "status": "neutral", "hint": "regime + confidence"},
+    ],
+    "disclaimer": "Fallback placeholder. Upstream snapshots unavailable.",
+})
+
+_REGIME_FALLBACK_TAIL = _json_tail({
+    "version": "v0.1-placeholder",
+    "regime": {"label": "—", "confidence": "—", "since": None},
+    "axes": [
+        {"key": "trend", "label": "Trend", "value": "—"},
+        {"key": "volatility", "label": "Volatility", "value": "—"},
+        {"key": "leverage", "label": "Leverage", "value": "—"},
+        {"key": "liquidity", "label": "Liquidity", "value": "—"},
+    ],
+    "drivers": ["—", "—", "—"],
+    "disclaimer": "Fallback placeholder. Upstream snapshots unavailable.",
+})
+
+_PAPER_FALLBACK_TAIL = _json_tail({
+    "version": "v0.1-placeholder",
+    "accounts": {"active": 0, "tracked": 0},
+    "kpis": {"equity_30d": "—", "win_rate": "—", "max_drawdown": "—", "active_positions": "—"},
+    "sample": {"name": "—", "equity_curve": []},
+    "disclaimer": "Fallback placeholder. Paper tables unavailable.",
+})
+
+
+# ---- Fixed-schema encoders for the polling endpoints ----
+# market_overview/asset_card always emit the same shape, so the skeleton is
+# encoded once into a %-template and each request only fills encoded leaves.
+
+_SLOT_RE = re.compile(r'"@(\w+)@"')
+
+
+def _compile_json_template(skeleton: Dict[str, Any]) -> str:
+    """Encode skeleton into a %-template; "@name@" string values become %(name)s slots."""
+    encoded = json.dumps(skeleton, ensure_ascii=False, separators=(",", ":"))
+    return _SLOT_RE.sub(r"%(\1)s", encoded.replace("%", "%%"))
+
+
+_encode_str = json.encoder.encode_basestring
+
+
+def _jv(v: str | None) -> str:
+    """Encode a template leaf (string or None) as a JSON value."""
+    return "null" if v is None else _encode_str(v)
+
+
+_SOURCES_SKELETON = {
+    "price": "@src_price@",
+    "funding": "@src_funding@",
+    "open_interest": "@src_oi@",
+    "liquidations": "@src_liq@",
+    "global": "@src_global@",
+}
+
+_OVERVIEW_TMPL = _compile_json_template({
+    "ts": "@ts@",
+    "kpis": [
+        {"key": "btc_price", "label": "BTC Price", "value": "@price@", "sub": "@price_sub@"},
+        {"key": "funding_oiw", "label": "Funding (OI-weighted)", "value": "@funding@", "sub": "BTC · Coinglass"},
+        {"key": "open_interest", "label": "Open Interest", "value": "@oi@", "sub": "@oi_sub@"},
+        {"key": "liq_24h", "label": "Liquidations (24h)", "value": "@liq@", "sub": "@liq_sub@"},
+    ],
+    "global": {
+        "btc_dominance": "@btc_dominance@",
+        "total_mcap": "@total_mcap@",
+        "total_vol_24h": "@total_vol_24h@",
+    },
+    "sources": _SOURCES_SKELETON,
+})
+
+_CARD_TMPL = _compile_json_template({
+    "ts": "@ts@",
+    "symbol": "@symbol@",
+    "card": {
+        "price": "@price@",
+        "change_24h": "@change_24h@",
+        "dominance": "@dominance@",
+        "vol_24h": "@vol_24h@",
+        "funding": "@funding@",
+        "open_interest": "@oi@",
+        "liquidations_24h": "@liq@",
+    },
+    "sources": _SOURCES_SKELETON,
+})
+
+
 def _src_ts(snap: dict | None) -> str | None:
     if snap and snap.get("updated_at"):
         return snap["updated_at"].isoformat()
     return None
 
 
+class _FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that skips requests without an Origin header up front.
+
+    Same-origin and server-to-server calls never carry Origin, so they bypass
+    Headers() construction entirely; allowed origins are matched via a set.
+    """
+
+    def __init__(self, app, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not any(k == b"origin" for k, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 app = FastAPI(title="EventEdge API", version="v1")
 
 app.add_middleware(
-    CORSMiddleware,
+    _FastCORSMiddleware,
     allow_origins=[
         "https://edgeblocks.io",
         "https://www.edgeblocks.io",
@@ -153,10 +300,43 @@ app.add_middleware(
 app.include_router(hypepipe_router)
 
 
+# ---- Backup status: refreshed off the request path ----
+# build_backup_status() walks the backup dir on disk; a background task keeps
+# the latest result so admin polling only reads a cached dict.
+
+_BACKUP_STATUS_REFRESH_S = 30
+_latest_backup_status: Dict[str, Any] | None = None
+_backup_status_task: asyncio.Task | None = None
+
+
+async def _refresh_backup_status_loop(interval_s: float) -> None:
+    global _latest_backup_status
+    while True:
+        try:
+            _latest_backup_status = await run_in_threadpool(build_backup_status)
+        except Exception:
+            logger.warning("backup status refresh failed", exc_info=True)
+        await asyncio.sleep(interval_s)
+
+
+@app.on_event("startup")
+async def _start_backup_status_refresh() -> None:
+    global _backup_status_task
+    _backup_status_task = asyncio.create_task(
+        _refresh_backup_status_loop(_BACKUP_STATUS_REFRESH_S)
+    )
+
+
+@app.on_event("shutdown")
+async def _stop_backup_status_refresh() -> None:
+    if _backup_status_task is not None:
+        _backup_status_task.cancel()
+
+
 @app.get("/api/v1/health")
 def health():
-    payload = {"ok": True, "service": "eventedge-api", "api": "v1", "ts": now_iso()}
-    return json_with_cache(payload, "public, max-age=5")
+    body = _HEALTH_PREFIX + now_iso().encode() + _HEALTH_SUFFIX
+    return json_bytes_with_cache(body, "public, max-age=5")
 
 
 @app.get("/api/v1/admin/health/services")
@@ -215,9 +395,9 @@ async def admin_health_heartbeat(request: Request):
 
 
 @app.get("/api/v1/admin/telemetry/overview")
-def admin_telemetry_overview():
+def admin_telemetry_overview(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_overview()
+        payload = build_telemetry_overview.refresh() if nocache else build_telemetry_overview()
         return json_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
@@ -232,10 +412,10 @@ def admin_telemetry_overview():
 
 
 @app.get("/api/v1/admin/telemetry/users")
-def admin_telemetry_users():
+def admin_telemetry_users(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_users()
-        return json_with_cache(payload, "no-store")
+        payload = build_telemetry_users.refresh() if nocache else build_telemetry_users()
+        return orjson_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
             content={
@@ -249,10 +429,10 @@ def admin_telemetry_users():
 
 
 @app.get("/api/v1/admin/telemetry/invites")
-def admin_telemetry_invites():
+def admin_telemetry_invites(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_invites()
-        return json_with_cache(payload, "no-store")
+        payload = build_telemetry_invites.refresh() if nocache else build_telemetry_invites()
+        return orjson_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
             content={
@@ -266,9 +446,9 @@ def admin_telemetry_invites():
 
 
 @app.get("/api/v1/admin/telemetry/alerts")
-def admin_telemetry_alerts():
+def admin_telemetry_alerts(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_alerts()
+        payload = build_telemetry_alerts.refresh() if nocache else build_telemetry_alerts()
         return json_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
@@ -278,9 +458,9 @@ def admin_telemetry_alerts():
 
 
 @app.get("/api/v1/admin/telemetry/paper")
-def admin_telemetry_paper():
+def admin_telemetry_paper(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_paper()
+        payload = build_telemetry_paper.refresh() if nocache else build_telemetry_paper()
         return json_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
@@ -290,10 +470,12 @@ def admin_telemetry_paper():
 
 
 @app.get("/api/v1/admin/telemetry/data")
-def admin_telemetry_data():
+def admin_telemetry_data(nocache: int = Query(0), columnar: int = Query(0), summary: int = Query(0)):
     try:
-        payload = build_telemetry_data()
-        return json_with_cache(payload, "no-store")
+        # Positional so the TTL cache keys on them.
+        args = (bool(columnar), bool(summary))
+        payload = build_telemetry_data.refresh(*args) if nocache else build_telemetry_data(*args)
+        return orjson_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
             content={"ok": False, "generated_at": now_iso(), "error": "Failed to build data telemetry"},
@@ -302,9 +484,9 @@ def admin_telemetry_data():
 
 
 @app.get("/api/v1/admin/telemetry/scanners")
-def admin_telemetry_scanners():
+def admin_telemetry_scanners(nocache: int = Query(0)):
     try:
-        payload = build_telemetry_scanners()
+        payload = build_telemetry_scanners.refresh() if nocache else build_telemetry_scanners()
         return json_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
@@ -418,7 +600,9 @@ def admin_telemetry_relevance_drift():
 @app.get("/api/v1/admin/ops/backup_status")
 def admin_ops_backup_status():
     try:
-        payload = build_backup_status()
+        payload = _latest_backup_status
+        if payload is None:
+            payload = build_backup_status()
         return json_with_cache(payload, "no-store")
     except Exception:
         return JSONResponse(
@@ -936,72 +1120,54 @@ def strategy_alerts_delete(alert_id: str):
 
 @app.get("/api/v1/market/overview")
 def market_overview():
-    price_snap = get_snapshot("coingecko:price_simple:usd:bitcoin")
-    funding_snap = get_snapshot("coinglass:oi_weighted_funding:BTC")
-    oi_snap = get_snapshot("coinglass:open_interest:BTC")
-    liq_snap = get_snapshot("coinglass:liquidations:BTC")
-    global_snap = get_snapshot("coingecko:global")
-
-    btc_price, btc_chg = (None, None)
-    if price_snap:
-        btc_price, btc_chg = extract_price(price_snap["payload"])
-
-    funding_pct = extract_funding(funding_snap["payload"]) if funding_snap else None
-    oi = extract_oi(oi_snap["payload"]) if oi_snap else {}
-    liq = extract_liquidations(liq_snap["payload"]) if liq_snap else {}
-    glob = extract_global(global_snap["payload"]) if global_snap else {}
-
-    payload = {
-        "ts": now_iso(),
-        "kpis": [
-            {
-                "key": "btc_price",
-                "label": "BTC Price",
-                "value": fmt_usd(btc_price),
-                "sub": f"{fmt_pct(btc_chg)} 24h" if btc_chg is not None else "—",
-            },
-            {
-                "key": "funding_oiw",
-                "label": "Funding (OI-weighted)",
-                "value": fmt_pct(funding_pct, 4) if funding_pct is not None else "—",
-                "sub": "BTC · Coinglass",
-            },
-            {
-                "key": "open_interest",
-                "label": "Open Interest",
-                "value": fmt_usd(oi.get("oi_usd")),
-                "sub": (
-                    f"{fmt_pct(oi.get('oi_change_24h'))} 24h"
-                    if oi.get("oi_change_24h") is not None
-                    else "—"
-                ),
-            },
-            {
-                "key": "liq_24h",
-                "label": "Liquidations (24h)",
-                "value": fmt_usd(liq.get("total_usd")),
-                "sub": (
-                    f"{liq.get('long_pct', 0):.0f}% long / {liq.get('short_pct', 0):.0f}% short"
-                    if liq.get("long_pct") is not None
-                    else "—"
-                ),
-            },
-        ],
-        "global": {
-            "btc_dominance": fmt_pct(glob.get("btc_dominance"), 1, signed=False),
-            "total_mcap": fmt_usd(glob.get("total_mcap_usd")),
-            "total_vol_24h": fmt_usd(glob.get("total_vol_usd")),
-        },
-        "sources": {
-            "price": _src_ts(price_snap),
-            "funding": _src_ts(funding_snap),
-            "open_interest": _src_ts(oi_snap),
-            "liquidations": _src_ts(liq_snap),
-            "global": _src_ts(global_snap),
-        },
+    snaps = get_snapshots((
+        "coingecko:price_simple:usd:bitcoin",
+        "coinglass:oi_weighted_funding:BTC",
+        "coinglass:open_interest:BTC",
+        "coinglass:liquidations:BTC",
+        "coingecko:global",
+    ))
+    price_snap = snaps.get("coingecko:price_simple:usd:bitcoin")
+    funding_snap = snaps.get("coinglass:oi_weighted_funding:BTC")
+    oi_snap = snaps.get("coinglass:open_interest:BTC")
+    liq_snap = snaps.get("coinglass:liquidations:BTC")
+    global_snap = snaps.get("coingecko:global")
+
+    btc_price, btc_chg = extract_price(snapshot_payload(price_snap))
+
+    funding_pct = extract_funding(snapshot_payload(funding_snap))
+    oi = extract_oi(snapshot_payload(oi_snap))
+    liq = extract_liquidations(snapshot_payload(liq_snap))
+    glob = extract_global(snapshot_payload(global_snap))
+
+    body = _OVERVIEW_TMPL % {
+        "ts": _jv(now_iso()),
+        "price": _jv(fmt_usd(btc_price)),
+        "price_sub": _jv(f"{fmt_pct(btc_chg)} 24h" if btc_chg is not None else "—"),
+        "funding": _jv(fmt_pct(funding_pct, 4) if funding_pct is not None else "—"),
+        "oi": _jv(fmt_usd(oi.get("oi_usd"))),
+        "oi_sub": _jv(
+            f"{fmt_pct(oi.get('oi_change_24h'))} 24h"
+            if oi.get("oi_change_24h") is not None
+            else "—"
+        ),
+        "liq": _jv(fmt_usd(liq.get("total_usd"))),
+        "liq_sub": _jv(
+            f"{liq.get('long_pct', 0):.0f}% long / {liq.get('short_pct', 0):.0f}% short"
+            if liq.get("long_pct") is not None
+            else "—"
+        ),
+        "btc_dominance": _jv(fmt_pct(glob.get("btc_dominance"), 1, signed=False)),
+        "total_mcap": _jv(fmt_usd(glob.get("total_mcap_usd"))),
+        "total_vol_24h": _jv(fmt_usd(glob.get("total_vol_usd"))),
+        "src_price": _jv(_src_ts(price_snap)),
+        "src_funding": _jv(_src_ts(funding_snap)),
+        "src_oi": _jv(_src_ts(oi_snap)),
+        "src_liq": _jv(_src_ts(liq_snap)),
+        "src_global": _jv(_src_ts(global_snap)),
     }
 
-    return json_with_cache(payload, "public, s-maxage=20, stale-while-revalidate=120")
+    return json_bytes_with_cache(body.encode("utf-8"), "public, s-maxage=20, stale-while-revalidate=120")
 
 
 @app.get("/api/v1/assets/{symbol}/card")
@@ -1012,45 +1178,44 @@ def asset_card(symbol: str):
 
     cg_id = "bitcoin" if sym == "BTC" else "ethereum"
 
-    price_snap = get_snapshot(f"coingecko:price_simple:usd:{cg_id}")
-    funding_snap = get_snapshot(f"coinglass:oi_weighted_funding:{sym}")
-    oi_snap = get_snapshot(f"coinglass:open_interest:{sym}")
-    liq_snap = get_snapshot(f"coinglass:liquidations:{sym}")
-    global_snap = get_snapshot("coingecko:global")
+    price_key = f"coingecko:price_simple:usd:{cg_id}"
+    funding_key = f"coinglass:oi_weighted_funding:{sym}"
+    oi_key = f"coinglass:open_interest:{sym}"
+    liq_key = f"coinglass:liquidations:{sym}"
+    snaps = get_snapshots((price_key, funding_key, oi_key, liq_key, "coingecko:global"))
+    price_snap = snaps.get(price_key)
+    funding_snap = snaps.get(funding_key)
+    oi_snap = snaps.get(oi_key)
+    liq_snap = snaps.get(liq_key)
+    global_snap = snaps.get("coingecko:global")
 
-    price, chg24 = (None, None)
-    if price_snap:
-        price, chg24 = extract_price(price_snap["payload"])
+    price, chg24 = extract_price(snapshot_payload(price_snap))
 
-    funding_pct = extract_funding(funding_snap["payload"]) if funding_snap else None
-    oi = extract_oi(oi_snap["payload"]) if oi_snap else {}
-    liq = extract_liquidations(liq_snap["payload"]) if liq_snap else {}
-    glob = extract_global(global_snap["payload"]) if global_snap else {}
+    funding_pct = extract_funding(snapshot_payload(funding_snap))
+    oi = extract_oi(snapshot_payload(oi_snap))
+    liq = extract_liquidations(snapshot_payload(liq_snap))
+    glob = extract_global(snapshot_payload(global_snap))
 
     dom_key = "btc_dominance" if sym == "BTC" else "eth_dominance"
 
-    payload = {
-        "ts": now_iso(),
-        "symbol": sym,
-        "card": {
-            "price": fmt_usd(price),
-            "change_24h": fmt_pct(chg24),
-            "dominance": fmt_pct(glob.get(dom_key), 1, signed=False),
-            "vol_24h": fmt_usd(glob.get("total_vol_usd")),
-            "funding": fmt_pct(funding_pct, 4) if funding_pct is not None else "—",
-            "open_interest": fmt_usd(oi.get("oi_usd")),
-            "liquidations_24h": fmt_usd(liq.get("total_usd")),
-        },
-        "sources": {
-            "price": _src_ts(price_snap),
-            "funding": _src_ts(funding_snap),
-            "open_interest": _src_ts(oi_snap),
-            "liquidations": _src_ts(liq_snap),
-            "global": _src_ts(global_snap),
-        },
+    body = _CARD_TMPL % {
+        "ts": _jv(now_iso()),
+        "symbol": _jv(sym),
+        "price": _jv(fmt_usd(price)),
+        "change_24h": _jv(fmt_pct(chg24)),
+        "dominance": _jv(fmt_pct(glob.get(dom_key), 1, signed=False)),
+        "vol_24h": _jv(fmt_usd(glob.get("total_vol_usd"))),
+        "funding": _jv(fmt_pct(funding_pct, 4) if funding_pct is not None else "—"),
+        "oi": _jv(fmt_usd(oi.get("oi_usd"))),
+        "liq": _jv(fmt_usd(liq.get("total_usd"))),
+        "src_price": _jv(_src_ts(price_snap)),
+        "src_funding": _jv(_src_ts(funding_snap)),
+        "src_oi": _jv(_src_ts(oi_snap)),
+        "src_liq": _jv(_src_ts(liq_snap)),
+        "src_global": _jv(_src_ts(global_snap)),
     }
 
-    return json_with_cache(payload, "public, s-maxage=20, stale-while-revalidate=120")
+    return json_bytes_with_cache(body.encode("utf-8"), "public, s-maxage=20, stale-while-revalidate=120")
 
 
 @app.get("/api/v1/sentiment/fear-greed")
@@ -1087,22 +1252,8 @@ def edge_supercard(symbol: str = Query("BTC")):
         sym = (symbol or "BTC").upper()
         if sym not in ("BTC", "ETH"):
             sym = "BTC"
-        payload = {
-            "ts": now_iso(),
-            "symbol": sym,
-            "version": "v0.1-placeholder",
-            "summary": {"headline": "—", "stance": "—", "confidence": "—", "notes": ["—", "—", "—"]},
-            "pillars": [
-                {"key": "flow", "label": "Flow", "value": "—", "status": "neutral", "hint": "pressure proxy"},
-                {"key": "leverage", "label": "Leverage", "value": "—", "status": "neutral", "hint": "OI + funding stress"},
-                {"key": "fragility", "label": "Fragility", "value": "—", "status": "neutral", "hint": "liq imbalance + spikes"},
-                {"key": "momentum", "label": "Momentum", "value": "—", "status": "neutral", "hint": "trend + volatility"},
-                {"key": "sentiment", "label": "Sentiment", "value": "—", "status": "neutral", "hint": "fear/greed"},
-                {"key": "risk", "label": "Risk", "value": "—", "status": "neutral", "hint": "regime + confidence"},
-            ],
-            "disclaimer": "Fallback placeholder. Upstream snapshots unavailable.",
-        }
-        return json_with_cache(payload, "public, s-maxage=20, stale-while-revalidate=300")
+        body = b'{"ts":"%s","symbol":"%s",' % (now_iso().encode(), sym.encode()) + _SUPERCARD_FALLBACK_TAIL
+        return json_bytes_with_cache(body, "public, s-maxage=20, stale-while-revalidate=300")
 
 
 @app.get("/api/v1/edge/regime")
@@ -1112,20 +1263,8 @@ def edge_regime():
         payload["ts"] = now_iso()
         return json_with_cache(payload, "public, s-maxage=20, stale-while-revalidate=300")
     except Exception:
-        payload = {
-            "ts": now_iso(),
-            "version": "v0.1-placeholder",
-            "regime": {"label": "—", "confidence": "—", "since": None},
-            "axes": [
-                {"key": "trend", "label": "Trend", "value": "—"},
-                {"key": "volatility", "label": "Volatility", "value": "—"},
-                {"key": "leverage", "label": "Leverage", "value": "—"},
-                {"key": "liquidity", "label": "Liquidity", "value": "—"},
-            ],
-            "drivers": ["—", "—", "—"],
-            "disclaimer": "Fallback placeholder. Upstream snapshots unavailable.",
-        }
-        return json_with_cache(payload, "public, s-maxage=20, stale-while-revalidate=300")
+        body = b'{"ts":"%s",' % now_iso().encode() + _REGIME_FALLBACK_TAIL
+        return json_bytes_with_cache(body, "public, s-maxage=20, stale-while-revalidate=300")
 
 
 @app.get("/api/v1/paper/summary")
@@ -1134,15 +1273,8 @@ def paper_summary():
         payload = build_paper_summary()
         return json_with_cache(payload, "public, s-maxage=15, stale-while-revalidate=120")
     except Exception:
-        payload = {
-            "ts": now_iso(),
-            "version": "v0.1-placeholder",
-            "accounts": {"active": 0, "tracked": 0},
-            "kpis": {"equity_30d": "—", "win_rate": "—", "max_drawdown": "—", "active_positions": "—"},
-            "sample": {"name": "—", "equity_curve": []},
-            "disclaimer": "Fallback placeholder. Paper tables unavailable.",
-        }
-        return json_with_cache(payload, "public, s-maxage=15, stale-while-revalidate=120")
+        body = b'{"ts":"%s",' % now_iso().encode() + _PAPER_FALLBACK_TAIL
+        return json_bytes_with_cache(body, "public, s-maxage=15, stale-while-revalidate=120")
 
 
 # ---- PERSONALIZATION-001 / RISK-PROFILE-001: User profiles + personalized relevance ----
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 
 BACKUP_DIR = Path(os.environ.get("BACKUP_DIR", "/srv/backups"))
 
-# Timestamp formats emitted by daily_backup_unified.sh
-_TS_FORMATS = [
-    "%Y-%m-%dT%H%M%SZ",    # 2026-02-19T030002Z  (standard)
-    "%Y-%m-%dT%H:%M:%SZ",  # 2026-02-19T03:00:02Z (alternate)
-]
+# Timestamp formats emitted by daily_backup_unified.sh:
+#   2026-02-19T030002Z    (standard, compact time)
+#   2026-02-19T03:00:02Z  (alternate, ISO-8601 — handled by fromisoformat)
+_COMPACT_TS = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2})(\d{2})(\d{2})Z")
 
 
 def _newest_daily_dir() -> Path | None:
@@ -53,15 +54,20 @@ def _parse_manifest(backup_dir: Path) -> dict:
 
 def _parse_ts(ts_str: str) -> datetime | None:
     """Parse a timestamp string trying known formats."""
-    for fmt in _TS_FORMATS:
+    m = _COMPACT_TS.fullmatch(ts_str)
+    if m:
         try:
-            return datetime.strptime(ts_str, fmt).replace(tzinfo=timezone.utc)
+            return datetime(*map(int, m.groups()), tzinfo=timezone.utc)
         except ValueError:
-            continue
-    return None
+            return None
+    try:
+        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
-def _infer_integrity(manifest: dict, backup_dir: Path) -> str:
+def _infer_integrity(manifest: dict, has_checksums: bool, has_archives: bool) -> str:
     """Determine integrity status from manifest field or filesystem markers.
 
     Priority:
@@ -77,11 +83,7 @@ def _infer_integrity(manifest: dict, backup_dir: Path) -> str:
     if explicit and explicit.upper() in ("OK", "WARN"):
         return explicit.upper()
 
-    # 2-4. Infer from filesystem
-    sha_path = backup_dir / "SHA256SUMS"
-    has_checksums = sha_path.exists()
-    has_archives = any(f.suffix == ".gz" for f in backup_dir.iterdir() if f.is_file())
-
+    # 2-4. Infer from filesystem markers (collected by _scan_backup_dir)
     if has_checksums:
         return "OK"
     if has_archives:
@@ -89,19 +91,36 @@ def _infer_integrity(manifest: dict, backup_dir: Path) -> str:
     return "MISSING"
 
 
-def _file_list(backup_dir: Path) -> list[dict]:
-    """Return a list of files in the backup directory with size."""
+class _DirScan(NamedTuple):
+    files: list[dict]
+    has_archives: bool
+    has_checksums: bool
+
+
+def _scan_backup_dir(backup_dir: Path) -> _DirScan:
+    """List files in the backup directory with size, in one scandir pass.
+
+    Also records whether any ``.gz`` archive and the SHA256SUMS marker are
+    present, so integrity inference needs no further directory reads.
+    """
     files = []
-    for f in sorted(backup_dir.iterdir()):
-        if not f.is_file():
-            continue
-        stat = f.stat()
+    has_archives = False
+    has_checksums = False
+    with os.scandir(backup_dir) as it:
+        entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+    for entry in entries:
+        name = entry.name
+        if name == "SHA256SUMS":
+            has_checksums = True
+        elif name.endswith(".gz"):
+            has_archives = True
+        size = entry.stat().st_size
         files.append({
-            "name": f.name,
-            "size_bytes": stat.st_size,
-            "size_human": _human_size(stat.st_size),
+            "name": name,
+            "size_bytes": size,
+            "size_human": _human_size(size),
         })
-    return files
+    return _DirScan(files, has_archives, has_checksums)
 
 
 def _human_size(nbytes: int) -> str:
@@ -153,16 +172,15 @@ def build_backup_status() -> dict:
     if backup_dt is not None:
         age_s = round((now - backup_dt).total_seconds(), 0)
 
-    # Integrity (003: infer from manifest + filesystem)
-    sha_path = backup_dir / "SHA256SUMS"
-    has_checksums = sha_path.exists()
-    integrity = _infer_integrity(manifest, backup_dir)
+    # File inventory + integrity markers (003: infer from manifest + filesystem)
+    scan = _scan_backup_dir(backup_dir)
+    files = scan.files
+    has_checksums = scan.has_checksums
+    integrity = _infer_integrity(manifest, has_checksums, scan.has_archives)
 
     # Disk usage
     disk = shutil.disk_usage(str(BACKUP_DIR))
 
-    # File inventory
-    files = _file_list(backup_dir)
     total_bytes = sum(f["size_bytes"] for f in files)
 
     # Health classification
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+from itertools import accumulate
 from typing import Any, Dict, List, Optional
 
 from .db import get_conn
@@ -25,14 +26,11 @@ def _downsample(points: List[Dict[str, Any]], max_pts: int = 60) -> List[Dict[st
 def _max_drawdown(vals: List[float]) -> Optional[float]:
     if not vals:
         return None
-    peak = vals[0]
-    mdd = 0.0
-    for v in vals:
-        if v > peak:
-            peak = v
-        dd = (peak - v) / peak if peak > 0 else 0.0
-        if dd > mdd:
-            mdd = dd
+    # Running peak via C-level accumulate; drawdown is relative to it.
+    mdd = max(
+        (peak - v) / peak if peak > 0 else 0.0
+        for peak, v in zip(accumulate(vals, max), vals)
+    )
     return mdd * 100.0
 
 
@@ -9,34 +9,41 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 
 from .snapshots import (
+    extract_fear_greed,
     extract_funding,
     extract_liquidations,
     extract_oi,
     extract_price,
     fmt_pct,
     fmt_usd,
-    get_snapshot,
+    get_snapshots,
+    snapshot_payload,
 )
 
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Constant tables
 # ---------------------------------------------------------------------------
 
-def _fg_value() -> Optional[int]:
-    """Read current Fear & Greed value from DB snapshot."""
-    ds = get_snapshot("altme:fear_greed")
-    if not ds:
-        return None
-    payload = ds.get("payload") or {}
-    data = payload.get("data") or []
-    if not data or not isinstance(data[0], dict):
-        return None
-    try:
-        return int(data[0].get("value"))
-    except (TypeError, ValueError):
-        return None
+_VOL_BUCKETS = ("calm", "chop", "shock")
+_LEV_BUCKETS = ("low", "neutral", "high")
+
+_VOL_LABELS = {"calm": "Calm", "chop": "Chop", "shock": "Shock"}
+_LEV_LABELS = {"low": "Light", "neutral": "Normal", "high": "Crowded"}
+_LIQ_LABELS = {"loose": "Loose", "normal": "Normal", "tight": "Tight"}
+
+# (key, label) per axis, in output order
+_AXES = (
+    ("trend", "Trend"),
+    ("volatility", "Volatility"),
+    ("leverage", "Leverage"),
+    ("liquidity", "Liquidity"),
+)
+
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
 def _bucket(
     x: Optional[float], lo: float, hi: float,
@@ -84,36 +91,43 @@ def _regime_label(
 # ---------------------------------------------------------------------------
 
 def build_regime() -> Dict[str, Any]:
-    # ---- fetch snapshots (BTC) ----
-    price_snap = get_snapshot("coingecko:price_simple:usd:bitcoin")
-    oi_snap = get_snapshot("coinglass:open_interest:BTC")
-    funding_snap = get_snapshot("coinglass:oi_weighted_funding:BTC")
-    liq_snap = get_snapshot("coinglass:liquidations:BTC")
+    # ---- fetch snapshots (BTC, one round-trip) ----
+    snaps = get_snapshots((
+        "coingecko:price_simple:usd:bitcoin",
+        "coinglass:open_interest:BTC",
+        "coinglass:oi_weighted_funding:BTC",
+        "coinglass:liquidations:BTC",
+        "altme:fear_greed",
+    ))
+    price_snap = snaps.get("coingecko:price_simple:usd:bitcoin")
+    oi_snap = snaps.get("coinglass:open_interest:BTC")
+    funding_snap = snaps.get("coinglass:oi_weighted_funding:BTC")
+    liq_snap = snaps.get("coinglass:liquidations:BTC")
 
     parts_ok = 0
 
     # ---- extract signals ----
-    price, chg24 = extract_price(price_snap["payload"]) if price_snap else (None, None)
+    price, chg24 = extract_price(snapshot_payload(price_snap))
     if chg24 is not None:
         parts_ok += 1
 
     # extract_funding returns percentage float (rate * 100)
-    funding_pct = extract_funding(funding_snap["payload"]) if funding_snap else None
+    funding_pct = extract_funding(snapshot_payload(funding_snap))
     if funding_pct is not None:
         parts_ok += 1
 
-    oi = extract_oi(oi_snap["payload"]) if oi_snap else {}
+    oi = extract_oi(snapshot_payload(oi_snap))
     oi_chg24 = oi.get("oi_change_24h")
     if oi_chg24 is not None:
         parts_ok += 1
 
-    liq = extract_liquidations(liq_snap["payload"]) if liq_snap else {}
+    liq = extract_liquidations(snapshot_payload(liq_snap))
     liq_total = liq.get("total_usd")
     liq_long_pct = liq.get("long_pct")
     if liq_total is not None:
         parts_ok += 1
 
-    fg = _fg_value()
+    fg, _ = extract_fear_greed(snapshot_payload(snaps.get("altme:fear_greed")))
 
     # ---- axes (simple buckets) ----
 
@@ -128,12 +142,12 @@ def build_regime() -> Dict[str, Any]:
         trend_label, trend_bkt = "Flat", "flat"
 
     # Volatility: liquidation total as "shockiness" proxy
-    vol_bkt = _bucket(liq_total, 25_000_000.0, 120_000_000.0, ("calm", "chop", "shock"))
-    vol_label = {"calm": "Calm", "chop": "Chop", "shock": "Shock"}.get(vol_bkt, "\u2014")
+    vol_bkt = _bucket(liq_total, 25_000_000.0, 120_000_000.0, _VOL_BUCKETS)
+    vol_label = _VOL_LABELS.get(vol_bkt, "\u2014")
 
     # Leverage: funding as crowding hint
-    lev_bkt = _bucket(funding_pct, -0.02, 0.10, ("low", "neutral", "high"))
-    lev_label = {"low": "Light", "neutral": "Normal", "high": "Crowded"}.get(lev_bkt, "\u2014")
+    lev_bkt = _bucket(funding_pct, -0.02, 0.10, _LEV_BUCKETS)
+    lev_label = _LEV_LABELS.get(lev_bkt, "\u2014")
 
     # Liquidity: liquidation skew as fragility proxy
     liq_bkt = "normal"
@@ -142,7 +156,7 @@ def build_regime() -> Dict[str, Any]:
             liq_bkt = "tight"
         elif liq_long_pct <= 40:
             liq_bkt = "loose"
-    liq_label = {"loose": "Loose", "normal": "Normal", "tight": "Tight"}.get(liq_bkt, "\u2014")
+    liq_label = _LIQ_LABELS.get(liq_bkt, "\u2014")
 
     # ---- regime + drivers ----
     label = _regime_label(trend_bkt, vol_bkt, lev_bkt, liq_bkt, fg)
@@ -157,21 +171,20 @@ def build_regime() -> Dict[str, Any]:
         drivers.append(
             f"Liqs {fmt_usd(liq_total)} \u2022 {fmt_pct(liq_long_pct, 0, signed=False)} long (fragility proxy)"
         )
-    if fg is not None:
+    # Only three drivers are rendered; skip formatting the fallback one if full.
+    if fg is not None and len(drivers) < 3:
         drivers.append(f"Fear & Greed {fg} (sentiment context)")
-    while len(drivers) < 3:
-        drivers.append("\u2014")
-    drivers = drivers[:3]
+    drivers.extend(("\u2014",) * (3 - len(drivers)))
 
     return {
         "ts": None,  # filled by caller
         "version": "v0.2-live",
         "regime": {"label": label, "confidence": conf, "since": None},
         "axes": [
-            {"key": "trend", "label": "Trend", "value": trend_label},
-            {"key": "volatility", "label": "Volatility", "value": vol_label},
-            {"key": "leverage", "label": "Leverage", "value": lev_label},
-            {"key": "liquidity", "label": "Liquidity", "value": liq_label},
+            {"key": key, "label": axis_label, "value": value}
+            for (key, axis_label), value in zip(
+                _AXES, (trend_label, vol_label, lev_label, liq_label)
+            )
         ],
         "drivers": drivers,
         "disclaimer": (
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from .db import get_conn
+from .snapshots import pct_formatter
 
 
+@lru_cache(maxsize=1024)
 def _hash_id(x: Any) -> str:
+    """10-hex-char redacted identifier (40-bit blake2b digest)."""
     b = str(x).encode("utf-8", "ignore")
-    return hashlib.sha1(b).hexdigest()[:10]
+    return hashlib.blake2b(b, digest_size=5).hexdigest()
+
+
+_USDT_SCALES = ((1_000_000, "M", 2), (1_000, "K", 1))
 
 
 def _fmt_usdt(x: Optional[float]) -> str:
@@ -21,10 +28,9 @@ def _fmt_usdt(x: Optional[float]) -> str:
         return "\u2014"
     s = "-" if v < 0 else ""
     v = abs(v)
-    if v >= 1_000_000:
-        return f"{s}${v/1_000_000:.2f}M"
-    if v >= 1_000:
-        return f"{s}${v/1_000:.1f}K"
+    for scale, suffix, digits in _USDT_SCALES:
+        if v >= scale:
+            return f"{s}${v / scale:.{digits}f}{suffix}"
     return f"{s}${v:.2f}"
 
 
@@ -32,41 +38,37 @@ def _fmt_pct(x: Optional[float], digits: int = 0) -> str:
     if x is None:
         return "\u2014"
     try:
-        return f"{float(x):.{digits}f}%"
+        return pct_formatter(digits)(float(x))
     except Exception:
         return "\u2014"
 
 
 def _downsample(points: List[Dict[str, float]], max_points: int = 60) -> List[Dict[str, float]]:
-    if len(points) <= max_points:
+    """Pick max_points evenly spaced points; first and last are always kept."""
+    n = len(points)
+    if n <= max_points or max_points < 2:
         return points
-    step = max(1, len(points) // max_points)
-    out = points[::step]
-    if out and points[-1] != out[-1]:
-        out[-1] = points[-1]
-    return out[:max_points]
-
-
-def _max_drawdown(vals: List[float]) -> Optional[float]:
-    if not vals:
-        return None
-    peak = vals[0]
-    mdd = 0.0
-    for v in vals:
-        if v > peak:
-            peak = v
-        dd = (peak - v) / peak if peak > 0 else 0.0
-        if dd > mdd:
-            mdd = dd
-    return mdd * 100.0
+    last = n - 1
+    span = max_points - 1
+    return [points[i * last // span] for i in range(max_points)]
+
+
+# Tables are not dropped at runtime, so a positive probe is remembered for the
+# life of the process; missing tables are re-probed since they may appear later.
+_known_tables: set[str] = set()
 
 
 def _table_exists(cur, name: str) -> bool:
+    if name in _known_tables:
+        return True
     cur.execute(
         "select 1 from information_schema.tables where table_schema='public' and table_name=%s limit 1",
         (name,),
     )
-    return cur.fetchone() is not None
+    found = cur.fetchone() is not None
+    if found:
+        _known_tables.add(name)
+    return found
 
 
 def _get_admin_account_ids(cur, tg_id: int) -> List[Any]:
@@ -102,50 +104,53 @@ def build_simlab_overview(tg_id: int, days: int = 30) -> Dict[str, Any]:
                 return out
 
             out["admin"]["accounts"]["total"] = len(acct_ids)
+            # One named-parameter dict is shared by every query below.
+            params = {"ids": acct_ids, "since": since}
 
-            # Open positions
-            open_positions = 0
-            active_accounts = set()
+            # Open positions (also reused for the per-account rollups below)
+            pos_by_acct: Dict[Any, int] = {}
             if _table_exists(cur, "paper_positions"):
                 cur.execute(
-                    "select account_id, count(*)::int from paper_positions where status='open' and account_id = any(%s::uuid[]) group by 1",
-                    (acct_ids,),
+                    "select account_id, count(*)::int from paper_positions where status='open' and account_id = any(%(ids)s::uuid[]) group by 1",
+                    params,
                 )
-                for aid, c in cur.fetchall():
-                    c = int(c or 0)
-                    if c > 0:
-                        active_accounts.add(aid)
-                    open_positions += c
+                pos_by_acct = {aid: int(c or 0) for aid, c in cur.fetchall()}
+            open_positions = sum(pos_by_acct.values())
+            active_accounts = {aid for aid, c in pos_by_acct.items() if c > 0}
 
             out["admin"]["accounts"]["active"] = len(active_accounts) if active_accounts else len(acct_ids)
             out["kpis"]["open_positions"] = open_positions
 
             # Trades + pnl + win rate + curve
-            wins = losses = 0
-            pnl_sum = 0.0
-            trades_n = 0
+            # One grouped scan yields per-account rollups; the totals and the
+            # last-trade timestamps are derived from it.
             last_trade_by_acct: Dict[Any, Optional[str]] = {aid: None for aid in acct_ids}
+            agg: Dict[Any, tuple] = {}
 
             if _table_exists(cur, "paper_trades"):
                 cur.execute(
                     """
-                    select account_id, created_at, net_pnl_usdt
+                    select account_id,
+                           count(*)::int as n,
+                           coalesce(sum(net_pnl_usdt), 0)::float as pnl,
+                           count(*) filter (where net_pnl_usdt > 0)::int as wins,
+                           count(*) filter (where net_pnl_usdt < 0)::int as losses,
+                           max(created_at) as last_ts
                     from paper_trades
-                    where created_at >= %s and account_id = any(%s::uuid[])
-                    order by created_at asc
+                    where created_at >= %(since)s and account_id = any(%(ids)s::uuid[])
+                    group by 1
                     """,
-                    (since, acct_ids),
+                    params,
                 )
-                rows = cur.fetchall()
-                trades_n = len(rows)
-                for aid, created_at, net_pnl in rows:
-                    p = float(net_pnl or 0.0)
-                    pnl_sum += p
-                    if p > 0:
-                        wins += 1
-                    elif p < 0:
-                        losses += 1
-                    last_trade_by_acct[aid] = str(created_at)
+                wins = losses = trades_n = 0
+                pnl_sum = 0.0
+                for aid, n, pnl, w, l, last_ts in cur.fetchall():
+                    agg[aid] = (float(pnl or 0.0), int(w or 0), int(l or 0))
+                    trades_n += int(n or 0)
+                    pnl_sum += float(pnl or 0.0)
+                    wins += int(w or 0)
+                    losses += int(l or 0)
+                    last_trade_by_acct[aid] = str(last_ts)
 
                 out["kpis"]["trades_30d"] = trades_n
                 out["kpis"]["pnl_30d_usdt"] = _fmt_usdt(pnl_sum)
@@ -153,72 +158,52 @@ def build_simlab_overview(tg_id: int, days: int = 30) -> Dict[str, Any]:
                 if total > 0:
                     out["kpis"]["win_rate"] = _fmt_pct((wins / total) * 100.0, 0)
 
+                # Running total, running peak and max drawdown are computed by
+                # window functions; Python only downsamples and formats.
                 cur.execute(
                     """
-                    select created_at::date as d, sum(net_pnl_usdt)::float as pnl
-                    from paper_trades
-                    where created_at >= %s and account_id = any(%s::uuid[])
-                    group by 1
-                    order by 1 asc
+                    with daily as (
+                        select created_at::date as d, coalesce(sum(net_pnl_usdt), 0) as pnl
+                        from paper_trades
+                        where created_at >= %(since)s and account_id = any(%(ids)s::uuid[])
+                        group by 1
+                    ), cum as (
+                        select d, sum(pnl) over (order by d) as cum
+                        from daily
+                    ), peaked as (
+                        select d, cum, max(cum) over (order by d) as peak
+                        from cum
+                    )
+                    select d,
+                           round(cum::numeric, 2)::float as v,
+                           (max(case when peak > 0 then (peak - cum) / peak else 0 end) over () * 100)::float as mdd
+                    from peaked
+                    order by d asc
                     """,
-                    (since, acct_ids),
+                    params,
                 )
-                cum = 0.0
-                curve: List[Dict[str, float]] = []
-                for d, pnl in cur.fetchall():
-                    cum += float(pnl or 0.0)
-                    curve.append({"t": str(d), "v": round(cum, 2)})
-                curve = _downsample(curve, 60)
-                out["curve"] = curve
-                mdd = _max_drawdown([float(p["v"]) for p in curve if isinstance(p.get("v"), (int, float))])
-                if mdd is not None:
-                    out["kpis"]["max_drawdown"] = _fmt_pct(mdd, 1)
-
-            # Per-account rollups
+                rows = cur.fetchall()
+                curve: List[Dict[str, float]] = [{"t": str(d), "v": v} for d, v, _ in rows]
+                out["curve"] = _downsample(curve, 60)
+                if rows:
+                    out["kpis"]["max_drawdown"] = _fmt_pct(rows[0][2], 1)
+
+            # Per-account rollups (one pass; ids hashed once per account)
             per: List[Dict[str, Any]] = []
             for aid in acct_ids:
+                hid = _hash_id(aid)
+                pnl, w, l = agg.get(aid, (None, 0, 0))
                 per.append(
                     {
-                        "id": _hash_id(aid),
-                        "name": f"acct-{_hash_id(aid)[:4]}",
-                        "pnl_30d_usdt": "\u2014",
-                        "win_rate": "\u2014",
-                        "open_positions": 0,
+                        "id": hid,
+                        "name": f"acct-{hid[:4]}",
+                        "pnl_30d_usdt": _fmt_usdt(pnl),
+                        "win_rate": _fmt_pct((w / (w + l)) * 100.0, 0) if (w + l) else "\u2014",
+                        "open_positions": pos_by_acct.get(aid, 0),
                         "last_trade_ts": last_trade_by_acct.get(aid),
                     }
                 )
 
-            if _table_exists(cur, "paper_trades"):
-                cur.execute(
-                    """
-                    select account_id,
-                           sum(net_pnl_usdt)::float as pnl,
-                           sum(case when net_pnl_usdt > 0 then 1 else 0 end)::int as wins,
-                           sum(case when net_pnl_usdt < 0 then 1 else 0 end)::int as losses
-                    from paper_trades
-                    where created_at >= %s and account_id = any(%s::uuid[])
-                    group by 1
-                    """,
-                    (since, acct_ids),
-                )
-                agg = {r[0]: (float(r[1] or 0.0), int(r[2] or 0), int(r[3] or 0)) for r in cur.fetchall()}
-                for i, aid in enumerate(acct_ids):
-                    if aid in agg:
-                        pnl, w, l = agg[aid]
-                        per[i]["pnl_30d_usdt"] = _fmt_usdt(pnl)
-                        tot = w + l
-                        if tot > 0:
-                            per[i]["win_rate"] = _fmt_pct((w / tot) * 100.0, 0)
-
-            if _table_exists(cur, "paper_positions"):
-                cur.execute(
-                    "select account_id, count(*)::int from paper_positions where status='open' and account_id = any(%s::uuid[]) group by 1",
-                    (acct_ids,),
-                )
-                pos = {r[0]: int(r[1] or 0) for r in cur.fetchall()}
-                for i, aid in enumerate(acct_ids):
-                    per[i]["open_positions"] = pos.get(aid, 0)
-
             out["per_account"] = per
 
     return out
@@ -5,21 +5,73 @@ Payload shapes are based on EE-API-004 discovery against edge_dataset_registry.
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, Dict, Optional, Tuple
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import orjson
 
 from .db import get_conn
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Read-through TTL cache
+# ---------------------------------------------------------------------------
+# Snapshots refresh on a minute-to-hourly cadence, so repeat reads within
+# SNAPSHOT_TTL_S are served from process memory. Confirmed-missing keys are
+# cached as None; failed queries are not cached. SNAPSHOT_TTL_S=0 disables.
+
+SNAPSHOT_TTL_S = float(os.environ.get("SNAPSHOT_TTL_S", "15"))
+
+# {dataset_key: (snapshot_or_None, fetched_at_monotonic)}
+_snap_cache: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+_snap_cache_lock = threading.Lock()
+
+
+def _snap_cache_get(dataset_key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Return (hit, snapshot). Hits are shallow copies so callers may mutate them."""
+    if SNAPSHOT_TTL_S <= 0:
+        return False, None
+    with _snap_cache_lock:
+        entry = _snap_cache.get(dataset_key)
+    if entry is None:
+        return False, None
+    snap, fetched_at = entry
+    if (time.monotonic() - fetched_at) > SNAPSHOT_TTL_S:
+        return False, None
+    return True, (dict(snap) if snap is not None else None)
+
+
+def _snap_cache_put(dataset_key: str, snap: Optional[Dict[str, Any]]) -> None:
+    if SNAPSHOT_TTL_S <= 0:
+        return
+    with _snap_cache_lock:
+        _snap_cache[dataset_key] = (snap, time.monotonic())
+
+
+def invalidate_snapshot(dataset_key: Optional[str] = None) -> None:
+    """Drop one cached snapshot (after a write), or the whole cache if no key."""
+    with _snap_cache_lock:
+        if dataset_key is None:
+            _snap_cache.clear()
+        else:
+            _snap_cache.pop(dataset_key, None)
+
+
 # ---------------------------------------------------------------------------
 # DB reader
 # ---------------------------------------------------------------------------
 
 def get_snapshot(dataset_key: str) -> Optional[Dict[str, Any]]:
     """Return {"payload": dict, "updated_at": datetime} or None."""
+    hit, snap = _snap_cache_get(dataset_key)
+    if hit:
+        return snap
     try:
         with get_conn() as conn:
             with conn.cursor() as cur:
@@ -29,62 +81,136 @@ def get_snapshot(dataset_key: str) -> Optional[Dict[str, Any]]:
                 )
                 row = cur.fetchone()
                 if not row:
+                    _snap_cache_put(dataset_key, None)
                     return None
                 payload_raw, updated_at = row
-                payload = json.loads(payload_raw) if isinstance(payload_raw, str) else payload_raw
-                return {"payload": payload, "updated_at": updated_at}
+                payload = orjson.loads(payload_raw) if isinstance(payload_raw, str) else payload_raw
+                snap = {"payload": payload, "updated_at": updated_at}
+                _snap_cache_put(dataset_key, snap)
+                return dict(snap)
     except Exception:
         logger.warning("get_snapshot failed for key=%s", dataset_key, exc_info=True)
         return None
 
 
+def get_snapshots(dataset_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch several snapshots in one round-trip.
+
+    Returns {dataset_key: {"payload": dict, "updated_at": datetime}}; keys
+    with no row are absent, so ``.get(key)`` behaves like get_snapshot().
+    Keys still fresh in the TTL cache are not queried.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for key in dataset_keys:
+        hit, snap = _snap_cache_get(key)
+        if not hit:
+            missing.append(key)
+        elif snap is not None:
+            out[key] = snap
+    if not missing:
+        return out
+    try:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT dataset_key, payload, updated_at FROM edge_dataset_registry "
+                    "WHERE dataset_key = ANY(%s)",
+                    (missing,),
+                )
+                fetched: Dict[str, Dict[str, Any]] = {}
+                for key, payload_raw, updated_at in cur.fetchall():
+                    payload = orjson.loads(payload_raw) if isinstance(payload_raw, str) else payload_raw
+                    fetched[key] = {"payload": payload, "updated_at": updated_at}
+    except Exception:
+        logger.warning("get_snapshots failed for keys=%s", missing, exc_info=True)
+        return out
+    for key in missing:
+        snap = fetched.get(key)
+        _snap_cache_put(key, snap)
+        if snap is not None:
+            out[key] = dict(snap)
+    return out
+
+
+def snapshot_payload(snap: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Payload of a snapshot row, or None if the snapshot is missing."""
+    return snap["payload"] if snap else None
+
+
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
+# fmt_* are pure and see a small, slowly-changing set of values across bursts
+# of requests, so results are memoized. Arguments must be hashable (numbers/None).
 
 def _num(x: Any) -> Optional[float]:
+    # jsonb numbers arrive as float/int; only strings need the try/except.
+    if x is None:
+        return None
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
     try:
         return float(x)
     except (TypeError, ValueError):
         return None
 
 
+_USD_SCALES = ((1_000_000_000, "B"), (1_000_000, "M"))
+
+
+@lru_cache(maxsize=8)
+def pct_formatter(digits: int) -> Callable[[float], str]:
+    """Bound str.format for "{:.<digits>f}%", so the spec is built once per digit count."""
+    return f"{{:.{digits}f}}%".format
+
+
+@lru_cache(maxsize=2048)
 def fmt_usd(n: Optional[float]) -> str:
     if n is None:
         return "—"
-    if abs(n) >= 1_000_000_000:
-        return f"${n / 1_000_000_000:.1f}B"
-    if abs(n) >= 1_000_000:
-        return f"${n / 1_000_000:.1f}M"
-    if abs(n) >= 1_000:
+    a = abs(n)
+    for scale, suffix in _USD_SCALES:
+        if a >= scale:
+            return f"${n / scale:.1f}{suffix}"
+    if a >= 1_000:
         return f"${n:,.0f}"
     return f"${n:,.2f}"
 
 
+@lru_cache(maxsize=2048)
 def fmt_pct(p: Optional[float], digits: int = 2, signed: bool = True) -> str:
     if p is None:
         return "—"
-    sign = "+" if signed and p > 0 else ""
-    return f"{sign}{p:.{digits}f}%"
+    text = pct_formatter(digits)(p)
+    return "+" + text if signed and p > 0 else text
 
 
 # ---------------------------------------------------------------------------
 # Extractors — matched to ACTUAL payload shapes from EE-API-004 discovery
 # ---------------------------------------------------------------------------
+# Each accepts None (missing snapshot) and returns its empty result.
 
-def extract_price(payload: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+def extract_price(payload: Optional[Dict[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
     """coingecko:price_simple:usd:{coin_id}
     Shape: {"data": {"price": 68819, "change_24h": -2.06}, ...}
     """
+    if not payload:
+        return None, None
     data = payload.get("data", {})
     return _num(data.get("price")), _num(data.get("change_24h"))
 
 
-def extract_global(payload: Dict[str, Any]) -> Dict[str, Any]:
+def extract_global(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """coingecko:global
     Shape: {"data": {"btc_dominance": 56.7, "eth_dominance": 9.8,
             "total_volume_usd": 103B, "total_market_cap_usd": 2.4T, ...}}
     """
+    if not payload:
+        return {}
     data = payload.get("data", {})
     return {
         "btc_dominance": _num(data.get("btc_dominance")),
@@ -95,21 +221,25 @@ def extract_global(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def extract_funding(payload: Dict[str, Any]) -> Optional[float]:
+def extract_funding(payload: Optional[Dict[str, Any]]) -> Optional[float]:
     """coinglass:oi_weighted_funding:{SYM}
     Shape: {"data": {"rate": 0.001178, "symbol": "BTC", "prev_rate": 0.003825}, ...}
     Rate is a fraction (0.001178 = 0.1178%).
     """
+    if not payload:
+        return None
     rate = _num(payload.get("data", {}).get("rate"))
     if rate is not None:
         return rate * 100  # convert to percentage
     return None
 
 
-def extract_oi(payload: Dict[str, Any]) -> Dict[str, Any]:
+def extract_oi(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """coinglass:open_interest:{SYM}
     Shape: {"data": {"oi_usd": 43.8B, "oi_change_24h": -1.91, "oi_billion": 43.8}, ...}
     """
+    if not payload:
+        return {}
     data = payload.get("data", {})
     return {
         "oi_usd": _num(data.get("oi_usd")),
@@ -117,31 +247,35 @@ def extract_oi(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def extract_liquidations(payload: Dict[str, Any]) -> Dict[str, Any]:
+def extract_liquidations(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """coinglass:liquidations:{SYM}
     Shape: {"raw": [{"exchange": "All", "liquidation_usd": 63M,
             "longLiquidation_usd": 51M, "shortLiquidation_usd": 11M}, ...]}
     First entry with exchange="All" has totals.
     """
+    if not payload:
+        return {}
     raw = payload.get("raw", [])
-    # Find the "All" exchange row
-    all_row = None
-    for r in raw:
-        if isinstance(r, dict) and r.get("exchange") == "All":
-            all_row = r
-            break
-    if all_row is None and raw:
-        all_row = raw[0]  # fallback to first row
-
-    if all_row is None:
+    if not raw:
         return {}
+    # The "All" aggregate row is normally first; otherwise scan for it and
+    # fall back to the first row.
+    first = raw[0]
+    if isinstance(first, dict) and first.get("exchange") == "All":
+        all_row = first
+    else:
+        all_row = next(
+            (r for r in raw if isinstance(r, dict) and r.get("exchange") == "All"),
+            first,
+        )
 
     total = _num(all_row.get("liquidation_usd"))
     long_usd = _num(all_row.get("longLiquidation_usd"))
     short_usd = _num(all_row.get("shortLiquidation_usd"))
 
-    long_pct = (long_usd / total * 100) if (total and long_usd is not None) else None
-    short_pct = (short_usd / total * 100) if (total and short_usd is not None) else None
+    scale = 100.0 / total if total else None
+    long_pct = long_usd * scale if (scale is not None and long_usd is not None) else None
+    short_pct = short_usd * scale if (scale is not None and short_usd is not None) else None
 
     return {
         "total_usd": total,
@@ -150,3 +284,21 @@ def extract_liquidations(payload: Dict[str, Any]) -> Dict[str, Any]:
         "long_pct": long_pct,
         "short_pct": short_pct,
     }
+
+
+def extract_fear_greed(payload: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Optional[str]]:
+    """altme:fear_greed
+    Shape: {"data": [{"value": "54", "value_classification": "Neutral", ...}, ...]}
+    First entry is the current reading.
+    """
+    if not payload:
+        return None, None
+    data = payload.get("data") or []
+    if not data or not isinstance(data[0], dict):
+        return None, None
+    row0 = data[0]
+    try:
+        v = int(row0.get("value"))
+    except (TypeError, ValueError):
+        v = None
+    return v, row0.get("value_classification")
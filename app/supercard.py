@@ -9,9 +9,10 @@ No formulas or weights are disclosed — only interpretable labels/buckets.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional
 
 from .snapshots import (
+    extract_fear_greed,
     extract_funding,
     extract_global,
     extract_liquidations,
@@ -19,7 +20,8 @@ from .snapshots import (
     extract_price,
     fmt_pct,
     fmt_usd,
-    get_snapshot,
+    get_snapshots,
+    snapshot_payload,
 )
 
 
@@ -38,8 +40,11 @@ def _bucket(x: Optional[float], lo: float, hi: float) -> str:
     return "neutral"
 
 
+_STATUS_BY_BUCKET = {"high": "positive", "low": "negative"}
+
+
 def _status(bucket: str) -> str:
-    return {"high": "positive", "low": "negative"}.get(bucket, "neutral")
+    return _STATUS_BY_BUCKET.get(bucket, "neutral")
 
 
 def _confidence(parts_ok: int) -> str:
@@ -68,25 +73,6 @@ def _stance(
     return "neutral"
 
 
-def _read_fear_greed() -> Tuple[Optional[int], Optional[str]]:
-    """Read current fear/greed value + label from the DB snapshot."""
-    ds = get_snapshot("altme:fear_greed")
-    if not ds:
-        return None, None
-    payload = ds.get("payload") or {}
-    data = payload.get("data") or []
-    if not data or not isinstance(data[0], dict):
-        return None, None
-    row0 = data[0]
-    v_raw = row0.get("value")
-    try:
-        v = int(v_raw)
-    except (TypeError, ValueError):
-        v = None
-    label = row0.get("value_classification")
-    return v, label
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -97,20 +83,27 @@ def build_supercard(symbol: str) -> Dict[str, Any]:
         sym = "BTC"
     cg_id = "bitcoin" if sym == "BTC" else "ethereum"
 
-    # ---- fetch snapshots ----
-    price_snap = get_snapshot(f"coingecko:price_simple:usd:{cg_id}")
-    funding_snap = get_snapshot(f"coinglass:oi_weighted_funding:{sym}")
-    oi_snap = get_snapshot(f"coinglass:open_interest:{sym}")
-    liq_snap = get_snapshot(f"coinglass:liquidations:{sym}")
-    global_snap = get_snapshot("coingecko:global")
+    # ---- fetch snapshots (one round-trip) ----
+    price_key = f"coingecko:price_simple:usd:{cg_id}"
+    funding_key = f"coinglass:oi_weighted_funding:{sym}"
+    oi_key = f"coinglass:open_interest:{sym}"
+    liq_key = f"coinglass:liquidations:{sym}"
+    snaps = get_snapshots(
+        (price_key, funding_key, oi_key, liq_key, "coingecko:global", "altme:fear_greed")
+    )
+    price_snap = snaps.get(price_key)
+    funding_snap = snaps.get(funding_key)
+    oi_snap = snaps.get(oi_key)
+    liq_snap = snaps.get(liq_key)
+    global_snap = snaps.get("coingecko:global")
 
     # ---- extract signals ----
-    price, chg24 = extract_price(price_snap["payload"]) if price_snap else (None, None)
+    price, chg24 = extract_price(snapshot_payload(price_snap))
     # extract_funding returns a percentage float (rate * 100)
-    funding_pct = extract_funding(funding_snap["payload"]) if funding_snap else None
-    oi = extract_oi(oi_snap["payload"]) if oi_snap else {}
-    liq = extract_liquidations(liq_snap["payload"]) if liq_snap else {}
-    glob = extract_global(global_snap["payload"]) if global_snap else {}
+    funding_pct = extract_funding(snapshot_payload(funding_snap))
+    oi = extract_oi(snapshot_payload(oi_snap))
+    liq = extract_liquidations(snapshot_payload(liq_snap))
+    glob = extract_global(snapshot_payload(global_snap))
 
     oi_usd = oi.get("oi_usd")
     oi_chg24 = oi.get("oi_change_24h")
@@ -120,7 +113,7 @@ def build_supercard(symbol: str) -> Dict[str, Any]:
     btc_dom = glob.get("btc_dominance")
     total_vol = glob.get("total_vol_usd")
 
-    fg_val, fg_label = _read_fear_greed()
+    fg_val, fg_label = extract_fear_greed(snapshot_payload(snaps.get("altme:fear_greed")))
 
     # ---- build pillars ----
     parts_ok = 0
@@ -190,15 +183,7 @@ def build_supercard(symbol: str) -> Dict[str, Any]:
         parts_ok += 1
 
     # Sentiment: fear & greed
-    if fg_val is not None:
-        if fg_val <= 25:
-            sent_bkt = "low"
-        elif fg_val >= 60:
-            sent_bkt = "high"
-        else:
-            sent_bkt = "neutral"
-    else:
-        sent_bkt = "neutral"
+    sent_bkt = _bucket(fg_val, 25, 60)
     sentiment = {
         "key": "sentiment",
         "label": "Sentiment",
@@ -240,9 +225,7 @@ def build_supercard(symbol: str) -> Dict[str, Any]:
         notes.append("Liquidations help gauge fragility and forced flow.")
     if fg_val is not None:
         notes.append("Sentiment adds a behavioral context layer.")
-    while len(notes) < 3:
-        notes.append("\u2014")
-    notes = notes[:3]
+    notes.extend(("\u2014",) * (3 - len(notes)))
 
     return {
         "ts": None,  # filled by caller
@@ -9,60 +9,49 @@ from datetime import datetime, timezone
 from typing import Any
 
 from .db import get_conn
-
-
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
-
-
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
-
-
-def _iso(val: Any) -> str | None:
-    if val is None:
-        return None
-    if hasattr(val, "isoformat"):
-        return val.isoformat()
-    return str(val)
-
-
-def _lifecycle(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "alert_lifecycle"):
-        return _unavailable()
-
-    cur.execute(
-        "SELECT COALESCE(event_type, 'unknown'), COUNT(*) "
-        "FROM alert_lifecycle "
-        "WHERE created_at > NOW() - INTERVAL '24 hours' "
-        "GROUP BY event_type ORDER BY COUNT(*) DESC"
-    )
-    breakdown_24h = {row[0]: row[1] for row in cur.fetchall()}
-
-    cur.execute(
-        "SELECT COALESCE(event_type, 'unknown'), COUNT(*) "
-        "FROM alert_lifecycle "
-        "WHERE created_at > NOW() - INTERVAL '7 days' "
-        "GROUP BY event_type ORDER BY COUNT(*) DESC"
-    )
-    breakdown_7d = {row[0]: row[1] for row in cur.fetchall()}
-
-    cur.execute(
-        "SELECT COUNT(*) FROM alert_lifecycle "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    total_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM alert_lifecycle "
-        "WHERE created_at > NOW() - INTERVAL '7 days'"
-    )
-    total_7d = cur.fetchone()[0]
+from .telemetry_common import existing_tables, invalidate_on_missing_table, iso, now_iso, unavailable
+from .ttl_cache import ttl_cache
+
+
+_TABLES = ("alert_lifecycle", "service_heartbeats")
+
+# One pass over the 7d window; the 24h figures are a FILTER on the same rows.
+_SQL_LIFECYCLE_AGG = (
+    "SELECT COALESCE(event_type, 'unknown'), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) "
+    "FROM alert_lifecycle "
+    "WHERE created_at > NOW() - INTERVAL '7 days' "
+    "GROUP BY 1 ORDER BY COUNT(*) DESC"
+)
+
+# Only a 200-char preview is shown, so the metadata blob is truncated server-side.
+_SQL_RECENT_ALERTS = (
+    "SELECT event_type, created_at, "
+    "  LEFT(metadata::text, 200) "
+    "FROM alert_lifecycle "
+    "ORDER BY created_at DESC LIMIT 20"
+)
+
+_SQL_ALERTD = (
+    "SELECT service_name, last_seen_at FROM service_heartbeats "
+    "WHERE service_name LIKE ANY (ARRAY['eventedge-alertd%', 'alertd%']) "
+    "ORDER BY last_seen_at DESC"
+)
+
+
+def _lifecycle(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "alert_lifecycle" not in existing:
+        return unavailable()
+
+    cur.execute(_SQL_LIFECYCLE_AGG)
+    rows = cur.fetchall()
+    breakdown_7d = {et: c7 for et, _, c7 in rows}
+    breakdown_24h = {
+        et: c24 for et, c24, _ in sorted(rows, key=lambda r: r[1], reverse=True) if c24
+    }
+    total_24h = sum(breakdown_24h.values())
+    total_7d = sum(breakdown_7d.values())
 
     return {
         "available": True,
@@ -75,63 +64,62 @@ def _lifecycle(cur: Any) -> dict[str, Any]:
     }
 
 
-def _recent_alerts(cur: Any) -> list[dict[str, Any]]:
-    if not _table_exists(cur, "alert_lifecycle"):
+def _recent_alerts(cur: Any, existing: set[str]) -> list[dict[str, Any]]:
+    if "alert_lifecycle" not in existing:
         return []
 
-    cur.execute(
-        "SELECT event_type, created_at, "
-        "  COALESCE(metadata::text, '') "
-        "FROM alert_lifecycle "
-        "ORDER BY created_at DESC LIMIT 20"
-    )
-    result = []
-    for row in cur.fetchall():
-        result.append({
-            "event_type": row[0],
-            "created_at": _iso(row[1]),
-            "payload_preview": row[2][:200] if row[2] else None,
-        })
-    return result
-
+    cur.execute(_SQL_RECENT_ALERTS)
+    return [
+        {
+            "event_type": event_type,
+            "created_at": iso(created_at),
+            "payload_preview": preview or None,
+        }
+        for event_type, created_at, preview in cur
+    ]
 
-def _alertd_status(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "service_heartbeats"):
-        return _unavailable()
 
-    now = datetime.now(timezone.utc)
-    cur.execute(
-        "SELECT service_name, last_seen_at FROM service_heartbeats "
-        "WHERE service_name LIKE 'eventedge-alertd%%' OR service_name LIKE 'alertd%%' "
-        "ORDER BY last_seen_at DESC"
-    )
-    rows = cur.fetchall()
-    if not rows:
-        return {"available": True, "daemons": []}
+def _alertd_status(cur: Any, existing: set[str], now: datetime) -> dict[str, Any]:
+    if "service_heartbeats" not in existing:
+        return unavailable()
 
+    cur.execute(_SQL_ALERTD)
     daemons = []
-    for name, last_seen in rows:
+    for name, last_seen in cur:
         age = (now - last_seen).total_seconds()
         status = "up" if age < 300 else ("stale" if age < 1800 else "down")
         daemons.append({
             "name": name,
             "status": status,
-            "last_seen_at": _iso(last_seen),
+            "last_seen_at": iso(last_seen),
             "age_s": round(age, 1),
         })
 
     return {"available": True, "daemons": daemons}
 
 
+@ttl_cache(seconds=10)
 def build_telemetry_alerts() -> dict[str, Any]:
-    now = datetime.now(timezone.utc).isoformat()
+    now_dt = datetime.now(timezone.utc)
     alerts: dict[str, Any] = {}
     errors: list[str] = []
 
+    # All sub-blocks share one transaction.  Each runs under its own savepoint
+    # so a failing block is rolled back alone instead of aborting the others.
     with get_conn() as conn:
+        # One snapshot for the whole request (consistent 24h/7d figures); psycopg2
+        # sends these options with its BEGIN, so this costs no extra round trip.
+        conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
         with conn.cursor() as cur:
             try:
-                lc = _lifecycle(cur)
+                existing = existing_tables(cur, _TABLES)
+            except Exception:
+                conn.rollback()
+                existing = set()
+
+            cur.execute("SAVEPOINT sb_lifecycle")
+            try:
+                lc = _lifecycle(cur, existing)
                 if lc.get("available"):
                     alerts["total_24h"] = lc["total_24h"]
                     alerts["total_7d"] = lc["total_7d"]
@@ -148,7 +136,8 @@ def build_telemetry_alerts() -> dict[str, Any]:
                     alerts["breakdown_7d"] = {}
                     errors.append(f"lifecycle: {lc.get('reason')}")
             except Exception as exc:
-                conn.rollback()
+                invalidate_on_missing_table(exc)
+                cur.execute("ROLLBACK TO SAVEPOINT sb_lifecycle")
                 alerts["total_24h"] = None
                 alerts["total_7d"] = None
                 alerts["fired_24h"] = None
@@ -157,24 +146,28 @@ def build_telemetry_alerts() -> dict[str, Any]:
                 alerts["breakdown_7d"] = {}
                 errors.append(f"lifecycle: {type(exc).__name__}")
 
+            cur.execute("SAVEPOINT sb_recent")
             try:
-                alerts["recent"] = _recent_alerts(cur)
+                alerts["recent"] = _recent_alerts(cur, existing)
             except Exception as exc:
-                conn.rollback()
+                invalidate_on_missing_table(exc)
+                cur.execute("ROLLBACK TO SAVEPOINT sb_recent")
                 alerts["recent"] = []
                 errors.append(f"recent: {type(exc).__name__}")
 
+            cur.execute("SAVEPOINT sb_alertd")
             try:
-                ad = _alertd_status(cur)
+                ad = _alertd_status(cur, existing, now_dt)
                 alerts["alertd"] = ad if ad.get("available") else {"daemons": []}
                 if not ad.get("available"):
                     errors.append(f"alertd: {ad.get('reason')}")
             except Exception as exc:
-                conn.rollback()
+                invalidate_on_missing_table(exc)
+                cur.execute("ROLLBACK TO SAVEPOINT sb_alertd")
                 alerts["alertd"] = {"daemons": []}
                 errors.append(f"alertd: {type(exc).__name__}")
 
-    result: dict[str, Any] = {"ok": True, "generated_at": now, "alerts": alerts}
+    result: dict[str, Any] = {"ok": True, "generated_at": now_iso(), "alerts": alerts}
     if errors:
         result["_errors"] = errors
     return result
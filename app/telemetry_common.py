@@ -0,0 +1,103 @@
+"""Helpers shared by the admin telemetry payload builders.
+
+One table-existence cache serves every telemetry module, so a table probed by
+one endpoint is not probed again by the next within the TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from .db import POOL_MAX
+
+
+# Concurrent telemetry sub-blocks share this many connection slots across all
+# telemetry executors, so a burst of admin rebuilds leaves part of the pool to
+# other endpoints instead of exhausting it and falling through to dedicated
+# connections.  Held only while a block runs on its connection.
+CONN_SLOTS = threading.BoundedSemaphore(max(1, POOL_MAX // 2))
+
+# to_regclass is a direct catalog lookup; information_schema.tables is a view
+# over pg_class/pg_namespace with privilege checks per row.
+_SQL_TABLES_PRESENT = (
+    "SELECT n FROM unnest(%s::text[]) AS n "
+    "WHERE to_regclass('public.' || n) IS NOT NULL"
+)
+
+# Table existence only changes on deploy; answers are memoized per process and
+# dropped early if a query hits a table that has since disappeared.
+_TABLE_EXISTS_TTL = 60.0
+_TABLE_EXISTS_CACHE: dict[str, tuple[float, bool]] = {}
+
+
+def clear_table_exists_cache() -> None:
+    _TABLE_EXISTS_CACHE.clear()
+
+
+# SQLSTATE undefined_table: a cached "present" answer is stale (table dropped).
+_UNDEFINED_TABLE = "42P01"
+
+
+def invalidate_on_missing_table(exc: BaseException) -> None:
+    if getattr(exc, "pgcode", None) == _UNDEFINED_TABLE:
+        clear_table_exists_cache()
+
+
+def existing_tables(cur: Any, names: tuple[str, ...]) -> set[str]:
+    """Return the subset of *names* present in the public schema.
+
+    Only names missing from the cache (or expired) are probed, in one query.
+    """
+    now = time.monotonic()
+    found: set[str] = set()
+    probe: list[str] = []
+    for name in names:
+        hit = _TABLE_EXISTS_CACHE.get(name)
+        if hit is None or hit[0] <= now:
+            probe.append(name)
+        elif hit[1]:
+            found.add(name)
+    if probe:
+        cur.execute(_SQL_TABLES_PRESENT, (probe,))
+        present = {row[0] for row in cur.fetchall()}
+        expiry = now + _TABLE_EXISTS_TTL
+        for name in probe:
+            _TABLE_EXISTS_CACHE[name] = (expiry, name in present)
+        found |= present
+    return found
+
+
+def table_exists(cur: Any, name: str) -> bool:
+    return name in existing_tables(cur, (name,))
+
+
+def unavailable(reason: str = "table not found") -> dict[str, Any]:
+    return {"available": False, "reason": reason}
+
+
+def iso(val: Any, _dt: type[datetime] = datetime) -> str | None:
+    # Timestamp columns decode to datetime: exact-type check before hasattr.
+    if val.__class__ is _dt:
+        return val.isoformat()
+    if val is None:
+        return None
+    if hasattr(val, "isoformat"):
+        return val.isoformat()
+    return str(val)
+
+
+# generated_at is display metadata only, so it is formatted at most once per second.
+_now_iso_sec = 0
+_now_iso_str = ""
+
+
+def now_iso() -> str:
+    global _now_iso_sec, _now_iso_str
+    sec = int(time.time())
+    if sec != _now_iso_sec:
+        _now_iso_str = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+        _now_iso_sec = sec
+    return _now_iso_str
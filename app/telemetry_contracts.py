@@ -7,20 +7,29 @@ Usage in future endpoint modules:
 
     from .telemetry_contracts import OverviewPayload
     payload = OverviewPayload(...)
-    return dataclasses.asdict(payload)
+    return payload.to_dict()
+
+Top-level payloads (and the blocks they nest) implement ``to_dict()`` by
+direct field access; ``dataclasses.asdict`` deep-copies recursively and is
+several times slower for payloads carrying hundreds of entries.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
+
+
+def _flat(obj: Any) -> dict[str, Any]:
+    """Shallow dict of a slotted dataclass whose fields are all scalars."""
+    return {name: getattr(obj, name) for name in obj.__slots__}
 
 
 # ---------------------------------------------------------------------------
 # 1. Overview
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class OverviewPayload:
     generated_at: str
     active_users_24h: int = 0
@@ -31,18 +40,21 @@ class OverviewPayload:
     services_down: int = 0
     abuse_blocks_24h: int = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        return _flat(self)
+
 
 # ---------------------------------------------------------------------------
 # 2. Users / Tiers / Invites
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TierEntry:
     tier: str
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LastSeenBuckets:
     h24: int = 0
     d7: int = 0
@@ -50,7 +62,7 @@ class LastSeenBuckets:
     unknown: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecentUserEntry:
     user_id: int
     tier: str
@@ -60,7 +72,7 @@ class RecentUserEntry:
     invite_source: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UsersBlock:
     total_users: Optional[int] = None
     new_24h: Optional[int] = None
@@ -71,26 +83,42 @@ class UsersBlock:
     last_seen_buckets: Optional[LastSeenBuckets] = None
     recent: list[RecentUserEntry] = field(default_factory=list)
 
-
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        lsb = self.last_seen_buckets
+        return {
+            "total_users": self.total_users,
+            "new_24h": self.new_24h,
+            "new_7d": self.new_7d,
+            "active_24h": self.active_24h,
+            "active_7d": self.active_7d,
+            "tiers": [_flat(t) for t in self.tiers],
+            "last_seen_buckets": _flat(lsb) if lsb is not None else None,
+            "recent": [_flat(r) for r in self.recent],
+        }
+
+
+@dataclass(slots=True)
 class UsersPayload:
     generated_at: str
     ok: bool = True
     users: UsersBlock = field(default_factory=UsersBlock)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"generated_at": self.generated_at, "ok": self.ok, "users": self.users.to_dict()}
+
 
 # ---------------------------------------------------------------------------
 # 2b. Invites
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InviteByTierEntry:
     tier: str
     codes: int
     total_uses: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InviteCodeDetail:
     code: str
     tier: str
@@ -103,7 +131,7 @@ class InviteCodeDetail:
     note: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecentRedemptionEntry:
     user_id: int
     code: str
@@ -111,7 +139,7 @@ class RecentRedemptionEntry:
     tier: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InvitesBlock:
     total_codes: Optional[int] = None
     created_24h: Optional[int] = None
@@ -126,19 +154,38 @@ class InvitesBlock:
     top_codes: list[InviteCodeDetail] = field(default_factory=list)
     recent_redemptions: list[RecentRedemptionEntry] = field(default_factory=list)
 
-
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_codes": self.total_codes,
+            "created_24h": self.created_24h,
+            "created_7d": self.created_7d,
+            "active": self.active,
+            "disabled": self.disabled,
+            "expired": self.expired,
+            "total_redeemed": self.total_redeemed,
+            "redeemed_24h": self.redeemed_24h,
+            "redeemed_7d": self.redeemed_7d,
+            "by_tier": [_flat(t) for t in self.by_tier],
+            "top_codes": [_flat(c) for c in self.top_codes],
+            "recent_redemptions": [_flat(r) for r in self.recent_redemptions],
+        }
+
+
+@dataclass(slots=True)
 class InvitesPayload:
     generated_at: str
     ok: bool = True
     invites: InvitesBlock = field(default_factory=InvitesBlock)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"generated_at": self.generated_at, "ok": self.ok, "invites": self.invites.to_dict()}
+
 
 # ---------------------------------------------------------------------------
 # 3. Menu Toggles
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeatureUsageEntry:
     menu_id: str
     label: str
@@ -148,7 +195,7 @@ class FeatureUsageEntry:
     last_toggle_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecentToggleEntry:
     user_id: int
     menu_id: str
@@ -156,51 +203,67 @@ class RecentToggleEntry:
     toggled_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuTogglesPayload:
     generated_at: str
     toggle_events_24h: int = 0
     feature_usage: list[FeatureUsageEntry] = field(default_factory=list)
     recent_toggles: list[RecentToggleEntry] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "toggle_events_24h": self.toggle_events_24h,
+            "feature_usage": [_flat(f) for f in self.feature_usage],
+            "recent_toggles": [_flat(t) for t in self.recent_toggles],
+        }
+
 
 # ---------------------------------------------------------------------------
 # 4. Provider / API Usage
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ProviderStats:
     calls: int = 0
     errors: int = 0
     avg_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     hit_rate_pct: float = 0.0
     total_hits: int = 0
     total_misses: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeCoreWsStats:
     connections_active: int = 0
     messages_24h: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiUsagePayload:
     generated_at: str
     api_calls_24h: dict[str, ProviderStats] = field(default_factory=dict)
     cache_stats: CacheStats = field(default_factory=CacheStats)
     edgecore_ws: EdgeCoreWsStats = field(default_factory=EdgeCoreWsStats)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "api_calls_24h": {k: _flat(v) for k, v in self.api_calls_24h.items()},
+            "cache_stats": _flat(self.cache_stats),
+            "edgecore_ws": _flat(self.edgecore_ws),
+        }
+
 
 # ---------------------------------------------------------------------------
 # 5. EdgeCore Freshness
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SnapshotEntry:
     snapshot_key: str
     updated_at: Optional[str]
@@ -210,19 +273,27 @@ class SnapshotEntry:
     payload_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeCorePayload:
     generated_at: str
     total_keys: int = 0
     stale_keys: int = 0
     snapshots: list[SnapshotEntry] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "total_keys": self.total_keys,
+            "stale_keys": self.stale_keys,
+            "snapshots": [_flat(e) for e in self.snapshots],
+        }
+
 
 # ---------------------------------------------------------------------------
 # 6. Scanners
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScannerEntry:
     scanner_id: str
     last_run_at: Optional[str]
@@ -232,17 +303,20 @@ class ScannerEntry:
     status: str  # "fresh" | "stale" | "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScannersPayload:
     generated_at: str
     scanners: list[ScannerEntry] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"generated_at": self.generated_at, "scanners": [_flat(e) for e in self.scanners]}
+
 
 # ---------------------------------------------------------------------------
 # 7. Paper Trader
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopAccountEntry:
     account_id: str
     user_id: int
@@ -251,7 +325,7 @@ class TopAccountEntry:
     open_positions: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperPayload:
     generated_at: str
     active_accounts: int = 0
@@ -261,12 +335,23 @@ class PaperPayload:
     total_pnl_usd: float = 0.0
     top_accounts: list[TopAccountEntry] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "active_accounts": self.active_accounts,
+            "open_positions": self.open_positions,
+            "trades_24h": self.trades_24h,
+            "events_24h": self.events_24h,
+            "total_pnl_usd": self.total_pnl_usd,
+            "top_accounts": [_flat(a) for a in self.top_accounts],
+        }
+
 
 # ---------------------------------------------------------------------------
 # 8. Alerts / Alertd
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlertdJobEntry:
     job_name: str
     last_run_at: Optional[str]
@@ -277,7 +362,7 @@ class AlertdJobEntry:
     errors_24h: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertsPayload:
     generated_at: str
     fired_24h: int = 0
@@ -287,12 +372,23 @@ class AlertsPayload:
     alertd_jobs: list[AlertdJobEntry] = field(default_factory=list)
     alertd_status: str = "unknown"
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "fired_24h": self.fired_24h,
+            "dismissed_24h": self.dismissed_24h,
+            "active_alerts": self.active_alerts,
+            "lifecycle_breakdown": dict(self.lifecycle_breakdown),
+            "alertd_jobs": [_flat(j) for j in self.alertd_jobs],
+            "alertd_status": self.alertd_status,
+        }
+
 
 # ---------------------------------------------------------------------------
 # 9. DB / Backups
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableSizeEntry:
     table_name: str
     size_mb: float
@@ -301,14 +397,14 @@ class TableSizeEntry:
     last_analyze: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     cpu_pct: float = 0.0
     mem_used_mb: float = 0.0
     disk_used_pct: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DbPayload:
     generated_at: str
     database_size_mb: float = 0.0
@@ -316,6 +412,15 @@ class DbPayload:
     largest_tables: list[TableSizeEntry] = field(default_factory=list)
     system_metrics: SystemMetrics = field(default_factory=SystemMetrics)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": self.generated_at,
+            "database_size_mb": self.database_size_mb,
+            "table_count": self.table_count,
+            "largest_tables": [_flat(t) for t in self.largest_tables],
+            "system_metrics": _flat(self.system_metrics),
+        }
+
 
 # ---------------------------------------------------------------------------
 # Endpoint registry (used by the stub summary route)
@@ -1,41 +1,82 @@
 """GET /api/v1/admin/telemetry/data — EdgeCore freshness + DB stats.
 
 Each sub-block is independently fault-tolerant.  No migrations required.
+Timestamps are left as datetime objects; the route serializes with orjson.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
-from .db import get_conn
+from .db import execute_prepared, get_conn
+from .telemetry_common import CONN_SLOTS, existing_tables, invalidate_on_missing_table, now_iso, unavailable
+from .ttl_cache import ttl_cache
 
 
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
+# Snapshot source table -> (key column, timestamp column), in preference order.
+_SNAPSHOT_COLS: dict[str, tuple[str, str]] = {
+    "edge_dataset_registry": ("dataset_key", "updated_at"),
+    "api_snapshots": ("data_type", "created_at"),
+}
+_TABLES = tuple(_SNAPSHOT_COLS)
+
+# Internal cooldown keys are filtered server-side so they are never sorted or sent.
+# age_s is cast to float8: EXTRACT returns numeric, which psycopg2 decodes into
+# a Decimal per row only for it to be converted to float again.
+# Freshness status is deliberately not computed here: the TTL/scope tables below
+# mirror edgecore's key registry and stay the single copy, and per-key policy is
+# memoized (_key_policy), so rows only pay one comparison each in Python.  Rows
+# are not capped either: every key is listed so dead ones stay visible.
+# Each query is prepared per pooled connection (execute_prepared).
+_SQL_EDGECORE: dict[str, str] = {
+    table: (
+        f"SELECT {key_col}, {ts_col}, "
+        f"  EXTRACT(EPOCH FROM NOW() - {ts_col})::float8 AS age_s "
+        f"FROM {table} "
+        f"WHERE {key_col} NOT LIKE '\\_cooldown:%' "
+        f"ORDER BY {key_col}"
     )
-    return cur.fetchone() is not None
-
-
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
-
-
-def _iso(val: Any) -> str | None:
-    if val is None:
-        return None
-    if hasattr(val, "isoformat"):
-        return val.isoformat()
-    return str(val)
+    for table, (key_col, ts_col) in _SNAPSHOT_COLS.items()
+}
 
+# Database size, user-table count and the 15 largest tables in one round trip.
+# pg_stat_user_tables is read once: COUNT(*) OVER () is taken before the LIMIT.
+# The LEFT JOIN keeps a row (with NULL table columns) if there are no tables.
+_SQL_DB_STATS = (
+    "SELECT d.db_bytes, COALESCE(t.table_count, 0), "
+    "  t.name, t.size_bytes, t.n_live_tup, t.last_vacuum, t.last_analyze "
+    "FROM (SELECT pg_database_size(current_database()) AS db_bytes) d "
+    "LEFT JOIN LATERAL ("
+    "  SELECT schemaname || '.' || relname AS name, "
+    "    pg_total_relation_size(relid) AS size_bytes, "
+    "    n_live_tup, "
+    "    last_vacuum, "
+    "    last_analyze, "
+    "    COUNT(*) OVER () AS table_count "
+    "  FROM pg_stat_user_tables "
+    "  ORDER BY size_bytes DESC "
+    "  LIMIT 15"
+    ") t ON true"
+)
+
+# Summary variant: size and table count only, no per-table relation sizes.
+_SQL_DB_SUMMARY = (
+    "SELECT pg_database_size(current_database()), "
+    "  (SELECT COUNT(*) FROM pg_stat_user_tables)"
+)
 
 
 # TTL lookup (seconds) — synced with edgecore/snapshots/keys.py _REGISTRY.
 # key prefix → expected TTL.  Longest prefix match wins.
-_TTL_MAP: dict[str, int] = {
+# The lookup tables are read-only views so they can be bound as defaults safely.
+_TTL_MAP: Mapping[str, int] = MappingProxyType({
     # CoinGecko
     "coingecko:global": 360,
     "coingecko:price_simple": 360,
@@ -104,14 +145,19 @@ _TTL_MAP: dict[str, int] = {
     # EdgeMind
     "edgemind:regime": 3600,
     "edgemind:router_top_features": 3600,
-}
+})
 
 # Sorted by descending prefix length for longest-prefix match
-_TTL_PREFIXES = sorted(_TTL_MAP.keys(), key=len, reverse=True)
+_TTL_PREFIXES = tuple(sorted(_TTL_MAP.keys(), key=len, reverse=True))
+# Alternation is tried left to right, so the length-sorted order above makes the
+# first match the longest one.  One C-level scan replaces a startswith per prefix.
+# (A dict-of-dicts trie walked per character in Python measured ~2x slower than
+# this regex; lookups are further memoized per key by _key_policy.)
+_TTL_RE = re.compile("|".join(map(re.escape, _TTL_PREFIXES)))
 
 # Active scopes — synced with edgecore/snapshots/keys.py _ACTIVE_SCOPES.
 # Keys not listed here: all scopes active.
-_ACTIVE_SCOPES: dict[str, tuple[str, ...]] = {
+_ACTIVE_SCOPES: Mapping[str, tuple[str, ...]] = MappingProxyType({
     "coinglass:funding_rate": ("BTC", "ETH"),
     "coinglass:open_interest": ("BTC", "ETH"),
     "coinglass:liquidations": ("BTC", "ETH"),
@@ -122,29 +168,48 @@ _ACTIVE_SCOPES: dict[str, tuple[str, ...]] = {
     "sosovalue:etf_flow": ("btc", "eth", "sol"),
     # EdgeBank — TA core (EB-TA-TRACK-002)
     "edgebank:ta_core": ("BTC", "ETH", "SOL", "HYPE"),
-}
-
-
-def _ttl_for_key(key: str) -> int | None:
+})
+# Scoped keys are "<provider>:<dataset>:<scope>" and every prefix above is
+# exactly "<provider>:<dataset>", so the prefix is found by splitting at the
+# second colon (scopes themselves may contain colons, e.g. "usd:bitcoin").
+_ACTIVE_SCOPES_SET: Mapping[str, frozenset[str]] = MappingProxyType({
+    prefix: frozenset(scopes) for prefix, scopes in _ACTIVE_SCOPES.items()
+})
+assert all(prefix.count(":") == 1 for prefix in _ACTIVE_SCOPES_SET)
+
+
+def _ttl_for_key(
+    key: str, _match: Callable[[str], Any] = _TTL_RE.match, _map: Mapping[str, int] = _TTL_MAP
+) -> int | None:
     """Return expected TTL in seconds, or None if unknown."""
-    for prefix in _TTL_PREFIXES:
-        if key.startswith(prefix):
-            return _TTL_MAP[prefix]
-    return None
+    m = _match(key)
+    return _map[m.group()] if m else None
 
 
-def _is_scope_active(key: str) -> bool:
+def _is_scope_active(
+    key: str, _scopes: Mapping[str, frozenset[str]] = _ACTIVE_SCOPES_SET
+) -> bool:
     """Return whether a scoped key is actively fetched.
 
     Matches the longest prefix in _ACTIVE_SCOPES and checks whether the
     scope suffix is in the active set.  Keys without a scope restriction
     return True.
     """
-    for prefix, scopes in _ACTIVE_SCOPES.items():
-        if key.startswith(prefix + ":"):
-            scope = key[len(prefix) + 1:]
-            return scope in scopes
-    return True
+    sep = key.find(":", key.find(":") + 1)
+    if sep < 0:
+        return True
+    scopes = _scopes.get(key[:sep])
+    return scopes is None or key[sep + 1:] in scopes
+
+
+@lru_cache(maxsize=4096)
+def _key_policy(key: str) -> tuple[int | None, bool]:
+    """(expected TTL, scope active) for a key.
+
+    Both depend only on the key, and the registry holds a stable set of keys,
+    so each key is resolved once per process rather than on every request.
+    """
+    return _ttl_for_key(key), _is_scope_active(key)
 
 
 def _classify(age_s: float, ttl_s: int | None, active: bool = True) -> str:
@@ -160,94 +225,133 @@ def _classify(age_s: float, ttl_s: int | None, active: bool = True) -> str:
     return "dead"
 
 
-def _edgecore_snapshots(cur: Any) -> dict[str, Any]:
-    """Snapshot freshness from edge_dataset_registry."""
+def _pack(
+    rows: Iterable[tuple[str, Any, Any]],
+    _policy: Callable[[str], tuple[int | None, bool]] = _key_policy,
+    _cls: Callable[[float, int | None, bool], str] = _classify,
+    _round: Callable[..., float] = round,
+    _float: type[float] = float,
+) -> list[dict[str, Any]]:
+    """Build snapshot entries; helpers are bound as defaults (fast local lookups)."""
+    return [
+        {
+            "key": key,
+            "updated_at": updated_at,
+            "age_s": _round(age, 1),
+            "ttl_s": ttl,
+            "status": _cls(age, ttl, active),
+        }
+        for key, updated_at, age_s in rows
+        for age in (_float(age_s or 0),)
+        for ttl, active in (_policy(key),)
+    ]
+
+
+def _pack_columns(
+    rows: Iterable[tuple[str, Any, Any]],
+    _policy: Callable[[str], tuple[int | None, bool]] = _key_policy,
+    _cls: Callable[[float, int | None, bool], str] = _classify,
+    _round: Callable[..., float] = round,
+    _float: type[float] = float,
+) -> dict[str, list[Any]]:
+    """Columnar form of _pack: one list per field, in row order."""
+    keys: list[str] = []
+    updated: list[datetime | None] = []
+    ages: list[float] = []
+    ttls: list[int | None] = []
+    statuses: list[str] = []
+    for key, updated_at, age_s in rows:
+        age = _float(age_s or 0)
+        ttl, active = _policy(key)
+        keys.append(key)
+        updated.append(updated_at)
+        ages.append(_round(age, 1))
+        ttls.append(ttl)
+        statuses.append(_cls(age, ttl, active))
+    return {"key": keys, "updated_at": updated, "age_s": ages, "ttl_s": ttls, "status": statuses}
+
+
+def _statuses(
+    rows: Iterable[tuple[str, Any, Any]],
+    _policy: Callable[[str], tuple[int | None, bool]] = _key_policy,
+    _cls: Callable[[float, int | None, bool], str] = _classify,
+    _float: type[float] = float,
+) -> Iterator[str]:
+    """Status per row only, for callers that just need the tallies."""
+    return (_cls(_float(age_s or 0), *_policy(key)) for key, _, age_s in rows)
+
+
+def _edgecore_snapshots(
+    cur: Any, existing: set[str], columnar: bool = False, summary: bool = False
+) -> dict[str, Any]:
+    """Snapshot freshness from edge_dataset_registry.
+
+    With *columnar*, ``snapshots`` is a dict of parallel per-field lists
+    instead of a list of per-key dicts (no repeated field names per row).
+    With *summary*, only the counters are returned and no entries are built.
+    """
     # Prefer edge_dataset_registry (EdgeCore SSOT), fall back to api_snapshots
-    table = None
-    for t in ("edge_dataset_registry", "api_snapshots"):
-        if _table_exists(cur, t):
-            table = t
-            break
+    table = next((t for t in _TABLES if t in existing), None)
     if table is None:
-        return _unavailable()
-
-    if table == "edge_dataset_registry":
-        key_col = "dataset_key"
-        ts_col = "updated_at"
+        return unavailable()
+
+    execute_prepared(cur, _SQL_EDGECORE[table])
+
+    # Status tallies are counted by Counter's C loop over the packed rows; the
+    # statuses are computed client-side (see _SQL_EDGECORE), so SQL cannot
+    # aggregate them without duplicating the TTL registry.
+    snapshots: Any = None
+    if summary:
+        counts = Counter(_statuses(cur))
+    elif columnar:
+        snapshots = _pack_columns(cur)
+        counts = Counter(snapshots["status"])
     else:
-        key_col = "data_type"
-        ts_col = "created_at"
-
-    cur.execute(
-        f"SELECT {key_col}, {ts_col}, "
-        f"  EXTRACT(EPOCH FROM NOW() - {ts_col}) AS age_s "
-        f"FROM {table} ORDER BY {key_col}"
-    )
-    rows = cur.fetchall()
-
-    # Skip internal cooldown keys
-    rows = [(k, ts, age) for k, ts, age in rows if not k.startswith("_cooldown:")]
+        snapshots = _pack(cur)
+        counts = Counter(map(itemgetter("status"), snapshots))
 
-    total = len(rows)
-    counts: dict[str, int] = {"fresh": 0, "stale": 0, "dead": 0, "disabled": 0, "unknown": 0}
-    snapshots = []
-    for key, updated_at, age_s in rows:
-        age = float(age_s or 0)
-        ttl = _ttl_for_key(key)
-        active = _is_scope_active(key)
-        status = _classify(age, ttl, active)
-        counts[status] += 1
-        snapshots.append({
-            "key": key,
-            "updated_at": _iso(updated_at),
-            "age_s": round(age, 1),
-            "ttl_s": ttl,
-            "status": status,
-        })
-
-    return {
+    result = {
         "available": True,
-        "total_keys": total,
+        "total_keys": counts.total(),
         "fresh": counts["fresh"],
         "stale": counts["stale"],
         "dead": counts["dead"],
         "disabled": counts["disabled"],
         "unknown": counts["unknown"],
-        "snapshots": snapshots,
     }
+    if not summary:
+        result["snapshots"] = snapshots
+    return result
 
 
-def _db_stats(cur: Any) -> dict[str, Any]:
-    """Database size + largest tables from pg_stat."""
+def _db_stats(cur: Any, summary: bool = False) -> dict[str, Any]:
+    """Database size + largest tables from pg_stat (size and count only with *summary*)."""
     try:
-        cur.execute("SELECT pg_database_size(current_database())")
-        db_bytes = cur.fetchone()[0]
+        if summary:
+            cur.execute(_SQL_DB_SUMMARY)
+            db_bytes, table_count = cur.fetchone()
+            return {
+                "available": True,
+                "database_mb": round(db_bytes / (1024 * 1024), 1) if db_bytes else 0,
+                "table_count": table_count,
+            }
+
+        cur.execute(_SQL_DB_STATS)
+        rows = cur.fetchall()
+        db_bytes, table_count = rows[0][0], rows[0][1]
         db_mb = round(db_bytes / (1024 * 1024), 1) if db_bytes else 0
 
-        cur.execute(
-            "SELECT schemaname || '.' || relname, "
-            "  pg_total_relation_size(relid), "
-            "  n_live_tup, "
-            "  last_vacuum, "
-            "  last_analyze "
-            "FROM pg_stat_user_tables "
-            "ORDER BY pg_total_relation_size(relid) DESC "
-            "LIMIT 15"
-        )
-        tables = []
-        for name, size_bytes, rows, vacuum, analyze in cur.fetchall():
-            tables.append({
+        tables = [
+            {
                 "table": name,
                 "size_mb": round((size_bytes or 0) / (1024 * 1024), 1),
-                "rows": int(rows or 0),
-                "last_vacuum": _iso(vacuum),
-                "last_analyze": _iso(analyze),
-            })
-
-        cur.execute(
-            "SELECT COUNT(*) FROM pg_stat_user_tables"
-        )
-        table_count = cur.fetchone()[0]
+                "rows": int(n_rows or 0),
+                "last_vacuum": vacuum,
+                "last_analyze": analyze,
+            }
+            for _, _, name, size_bytes, n_rows, vacuum, analyze in rows
+            if name is not None
+        ]
 
         return {
             "available": True,
@@ -256,51 +360,80 @@ def _db_stats(cur: Any) -> dict[str, Any]:
             "largest_tables": tables,
         }
     except Exception:
-        return _unavailable("pg_stat query failed")
+        return unavailable("pg_stat query failed")
 
 
-def build_telemetry_data() -> dict[str, Any]:
-    now = datetime.now(timezone.utc).isoformat()
-    data: dict[str, Any] = {}
-    errors: list[str] = []
-
-    with get_conn() as conn:
+def _run_block(fn: Callable[[Any], dict[str, Any]]) -> dict[str, Any]:
+    """Run one sub-block on its own pooled, read-only connection."""
+    with CONN_SLOTS, get_conn() as conn:
+        conn.set_session(readonly=True)
         with conn.cursor() as cur:
             try:
-                ec = _edgecore_snapshots(cur)
-                if ec.get("available"):
-                    data["edgecore"] = {
-                        "total_keys": ec["total_keys"],
-                        "fresh": ec["fresh"],
-                        "stale": ec["stale"],
-                        "dead": ec["dead"],
-                        "disabled": ec["disabled"],
-                        "unknown": ec["unknown"],
-                        "snapshots": ec["snapshots"],
-                    }
-                else:
-                    data["edgecore"] = None
-                    errors.append(f"edgecore: {ec.get('reason')}")
+                return fn(cur)
             except Exception as exc:
-                conn.rollback()
-                data["edgecore"] = None
-                errors.append(f"edgecore: {type(exc).__name__}")
+                invalidate_on_missing_table(exc)
+                raise
 
-            try:
-                db = _db_stats(cur)
-                if db.get("available"):
-                    data["database"] = {
-                        "database_mb": db["database_mb"],
-                        "table_count": db["table_count"],
-                        "largest_tables": db["largest_tables"],
-                    }
-                else:
-                    data["database"] = None
-                    errors.append(f"database: {db.get('reason')}")
-            except Exception as exc:
-                conn.rollback()
-                data["database"] = None
-                errors.append(f"database: {type(exc).__name__}")
+
+def _edgecore_block(cur: Any, columnar: bool = False, summary: bool = False) -> dict[str, Any]:
+    return _edgecore_snapshots(cur, existing_tables(cur, _TABLES), columnar, summary)
+
+
+# Shared across requests; worker threads are started on first use and reused.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="telemetry-data")
+
+
+@ttl_cache(seconds=30)
+def build_telemetry_data(columnar: bool = False, summary: bool = False) -> dict[str, Any]:
+    """Build the data telemetry payload (``columnar``/``summary``: see _edgecore_snapshots).
+
+    With *summary*, ``snapshots`` and ``largest_tables`` are omitted.
+    """
+    now = now_iso()
+    data: dict[str, Any] = {}
+    errors: list[str] = []
+
+    # The sub-blocks read disjoint tables, so they run concurrently on separate
+    # connections; wall time is the slower block rather than the sum.  A failure
+    # stays confined to its own block (and its own connection).
+    ec_fut = _EXECUTOR.submit(_run_block, partial(_edgecore_block, columnar=columnar, summary=summary))
+    db_fut = _EXECUTOR.submit(_run_block, partial(_db_stats, summary=summary))
+
+    try:
+        ec = ec_fut.result()
+        if ec.get("available"):
+            data["edgecore"] = {
+                "total_keys": ec["total_keys"],
+                "fresh": ec["fresh"],
+                "stale": ec["stale"],
+                "dead": ec["dead"],
+                "disabled": ec["disabled"],
+                "unknown": ec["unknown"],
+            }
+            if "snapshots" in ec:
+                data["edgecore"]["snapshots"] = ec["snapshots"]
+        else:
+            data["edgecore"] = None
+            errors.append(f"edgecore: {ec.get('reason')}")
+    except Exception as exc:
+        data["edgecore"] = None
+        errors.append(f"edgecore: {type(exc).__name__}")
+
+    try:
+        db = db_fut.result()
+        if db.get("available"):
+            data["database"] = {
+                "database_mb": db["database_mb"],
+                "table_count": db["table_count"],
+            }
+            if "largest_tables" in db:
+                data["database"]["largest_tables"] = db["largest_tables"]
+        else:
+            data["database"] = None
+            errors.append(f"database: {db.get('reason')}")
+    except Exception as exc:
+        data["database"] = None
+        errors.append(f"database: {type(exc).__name__}")
 
     result: dict[str, Any] = {"ok": True, "generated_at": now, "data": data}
     if errors:
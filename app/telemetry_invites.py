@@ -2,75 +2,57 @@
 
 Each sub-block is independently fault-tolerant: if a table is missing or a query
 fails, the sub-block returns ``available: false`` and the rest of the payload is
-unaffected.  No migrations required.
+unaffected.  No migrations required.  Timestamps are left as datetime objects;
+the route serializes with orjson.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
-
-from .db import get_conn
-
-
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
-
-
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
-
-
-def _iso(val: Any) -> str | None:
-    if val is None:
-        return None
-    if hasattr(val, "isoformat"):
-        return val.isoformat()
-    return str(val)
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .db import execute_prepared, get_conn
+from .telemetry_common import CONN_SLOTS, existing_tables, invalidate_on_missing_table, now_iso, unavailable
+from .ttl_cache import ttl_cache
+
+
+_TABLES = ("invite_codes", "invite_redemptions")
+
+# One scan of invite_codes yields both the totals and the per-tier breakdown:
+# the () grouping set is the grand-total row (GROUPING(tier) = 1), ordered
+# first; each figure is a FILTER on the same rows.
+# The count queries run on every poll, so they are prepared per connection.
+_SQL_CODE_STATS = (
+    "SELECT GROUPING(tier), COALESCE(tier, 'unknown'), COUNT(*), "
+    "  COALESCE(SUM(uses), 0), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '7 days'), "
+    "  COUNT(*) FILTER (WHERE is_enabled = TRUE), "
+    "  COUNT(*) FILTER (WHERE is_enabled = FALSE), "
+    "  COUNT(*) FILTER (WHERE expires_at IS NOT NULL AND expires_at < NOW()) "
+    "FROM invite_codes "
+    "GROUP BY GROUPING SETS ((tier), ()) "
+    "ORDER BY GROUPING(tier) DESC, COUNT(*) DESC"
+)
+
+_SQL_REDEMPTION_COUNTS = (
+    "SELECT COUNT(*), "
+    "  COUNT(*) FILTER (WHERE redeemed_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) FILTER (WHERE redeemed_at > NOW() - INTERVAL '7 days') "
+    "FROM invite_redemptions"
+)
 
 
 # -- Sub-block builders ------------------------------------------------------
 
-def _code_counts(cur: Any) -> dict[str, Any]:
-    """Total codes, created 24h/7d, active/expired/disabled counts."""
-    if not _table_exists(cur, "invite_codes"):
-        return _unavailable()
-
-    cur.execute("SELECT COUNT(*) FROM invite_codes")
-    total = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    created_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes "
-        "WHERE created_at > NOW() - INTERVAL '7 days'"
-    )
-    created_7d = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes WHERE is_enabled = TRUE"
-    )
-    active = cur.fetchone()[0]
+def _code_stats(cur: Any, existing: set[str]) -> dict[str, Any]:
+    """Total codes, created 24h/7d, active/expired/disabled, and usage by tier."""
+    if "invite_codes" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes WHERE is_enabled = FALSE"
-    )
-    disabled = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes "
-        "WHERE expires_at IS NOT NULL AND expires_at < NOW()"
-    )
-    expired = cur.fetchone()[0]
+    execute_prepared(cur, _SQL_CODE_STATS)
+    rows = cur.fetchall()
+    _, _, total, _, created_24h, created_7d, active, disabled, expired = rows[0]
 
     return {
         "available": True,
@@ -80,28 +62,20 @@ def _code_counts(cur: Any) -> dict[str, Any]:
         "active": active,
         "disabled": disabled,
         "expired": expired,
+        "by_tier": [
+            {"tier": tier, "codes": codes, "total_uses": int(uses)}
+            for _, tier, codes, uses, *_ in rows[1:]
+        ],
     }
 
 
-def _redemption_counts(cur: Any) -> dict[str, Any]:
+def _redemption_counts(cur: Any, existing: set[str]) -> dict[str, Any]:
     """Total redemptions, redeemed 24h/7d."""
-    if not _table_exists(cur, "invite_redemptions"):
-        return _unavailable()
-
-    cur.execute("SELECT COUNT(*) FROM invite_redemptions")
-    total = cur.fetchone()[0]
+    if "invite_redemptions" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_redemptions "
-        "WHERE redeemed_at > NOW() - INTERVAL '24 hours'"
-    )
-    redeemed_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_redemptions "
-        "WHERE redeemed_at > NOW() - INTERVAL '7 days'"
-    )
-    redeemed_7d = cur.fetchone()[0]
+    execute_prepared(cur, _SQL_REDEMPTION_COUNTS)
+    total, redeemed_24h, redeemed_7d = cur.fetchone()
 
     return {
         "available": True,
@@ -111,26 +85,13 @@ def _redemption_counts(cur: Any) -> dict[str, Any]:
     }
 
 
-def _by_tier(cur: Any) -> list[dict[str, Any]]:
-    """Codes grouped by tier with usage counts."""
-    if not _table_exists(cur, "invite_codes"):
-        return []
-
-    cur.execute(
-        "SELECT COALESCE(tier, 'unknown'), COUNT(*), COALESCE(SUM(uses), 0) "
-        "FROM invite_codes GROUP BY tier ORDER BY COUNT(*) DESC"
-    )
-    return [
-        {"tier": row[0], "codes": row[1], "total_uses": int(row[2])}
-        for row in cur.fetchall()
-    ]
-
-
-def _top_codes(cur: Any) -> list[dict[str, Any]]:
+def _top_codes(cur: Any, existing: set[str]) -> list[dict[str, Any]]:
     """Top 20 most-redeemed invite codes."""
-    if not _table_exists(cur, "invite_codes"):
+    if "invite_codes" not in existing:
         return []
 
+    # ORDER BY matches invite_codes_uses_desc_idx (docs/ADMIN_TELEMETRY_PLAN.md),
+    # so with the index in place this is a 20-row index scan, not a sort.
     cur.execute(
         "SELECT code, tier, uses, max_uses, is_enabled, created_at, "
         "  created_by, expires_at, note "
@@ -139,18 +100,18 @@ def _top_codes(cur: Any) -> list[dict[str, Any]]:
         "LIMIT 20"
     )
     result = []
-    for row in cur.fetchall():
+    for row in cur:
         entry: dict[str, Any] = {
             "code": row[0],
             "tier": row[1],
             "uses": row[2],
             "max_uses": row[3],
             "is_enabled": row[4],
-            "created_at": _iso(row[5]),
+            "created_at": row[5],
             "created_by": row[6],
         }
         if row[7] is not None:
-            entry["expires_at"] = _iso(row[7])
+            entry["expires_at"] = row[7]
         if row[8] is not None:
             entry["note"] = row[8]
         result.append(entry)
@@ -158,14 +119,12 @@ def _top_codes(cur: Any) -> list[dict[str, Any]]:
     return result
 
 
-def _recent_redemptions(cur: Any) -> list[dict[str, Any]]:
+def _recent_redemptions(cur: Any, existing: set[str]) -> list[dict[str, Any]]:
     """20 most recent redemptions with optional code tier."""
-    if not _table_exists(cur, "invite_redemptions"):
+    if "invite_redemptions" not in existing:
         return []
 
-    has_codes = _table_exists(cur, "invite_codes")
-
-    if has_codes:
+    if "invite_codes" in existing:
         cur.execute(
             "SELECT ir.user_id, ir.code, ir.redeemed_at, ic.tier "
             "FROM invite_redemptions ir "
@@ -183,105 +142,120 @@ def _recent_redemptions(cur: Any) -> list[dict[str, Any]]:
         {
             "user_id": row[0],
             "code": row[1],
-            "redeemed_at": _iso(row[2]),
+            "redeemed_at": row[2],
             **({"tier": row[3]} if row[3] is not None else {}),
         }
-        for row in cur.fetchall()
+        for row in cur
     ]
 
 
 # -- Main builder -----------------------------------------------------------
 
+def _run_block(fn: Callable[[Any, set[str]], Any]) -> Any:
+    """Run one sub-block on its own pooled, read-only connection."""
+    with CONN_SLOTS, get_conn() as conn:
+        conn.set_session(readonly=True)
+        with conn.cursor() as cur:
+            try:
+                return fn(cur, existing_tables(cur, _TABLES))
+            except Exception as exc:
+                invalidate_on_missing_table(exc)
+                raise
+
+
 _BLOCKS: list[tuple[str, str]] = [
-    ("codes", "_code_counts"),
+    ("codes", "_code_stats"),
     ("redemptions", "_redemption_counts"),
-    ("by_tier", "_by_tier"),
     ("top_codes", "_top_codes"),
     ("recent_redemptions", "_recent_redemptions"),
 ]
 
 _BUILDERS = {
-    "_code_counts": _code_counts,
+    "_code_stats": _code_stats,
     "_redemption_counts": _redemption_counts,
-    "_by_tier": _by_tier,
     "_top_codes": _top_codes,
     "_recent_redemptions": _recent_redemptions,
 }
 
+# Shared across requests; worker threads are started on first use and reused.
+_EXECUTOR = ThreadPoolExecutor(max_workers=len(_BLOCKS), thread_name_prefix="telemetry-invites")
+
 
+@ttl_cache(seconds=30)
 def build_telemetry_invites() -> dict[str, Any]:
     """Build the invites telemetry payload. Each sub-block is fault-tolerant."""
-    now = datetime.now(timezone.utc).isoformat()
+    now = now_iso()
     invites: dict[str, Any] = {}
     errors: list[str] = []
 
-    with get_conn() as conn:
-        with conn.cursor() as cur:
-            # Code counts → flatten into invites
-            try:
-                codes = _code_counts(cur)
-                if codes.get("available"):
-                    invites["total_codes"] = codes["total_codes"]
-                    invites["created_24h"] = codes["created_24h"]
-                    invites["created_7d"] = codes["created_7d"]
-                    invites["active"] = codes["active"]
-                    invites["disabled"] = codes["disabled"]
-                    invites["expired"] = codes["expired"]
-                else:
-                    invites["total_codes"] = None
-                    invites["created_24h"] = None
-                    invites["created_7d"] = None
-                    invites["active"] = None
-                    invites["disabled"] = None
-                    invites["expired"] = None
-                    errors.append(f"codes: {codes.get('reason', 'unavailable')}")
-            except Exception as exc:
-                invites["total_codes"] = None
-                invites["created_24h"] = None
-                invites["created_7d"] = None
-                invites["active"] = None
-                invites["disabled"] = None
-                invites["expired"] = None
-                errors.append(f"codes: {type(exc).__name__}")
-
-            # Redemption counts → flatten
-            try:
-                reds = _redemption_counts(cur)
-                if reds.get("available"):
-                    invites["total_redeemed"] = reds["total_redeemed"]
-                    invites["redeemed_24h"] = reds["redeemed_24h"]
-                    invites["redeemed_7d"] = reds["redeemed_7d"]
-                else:
-                    invites["total_redeemed"] = None
-                    invites["redeemed_24h"] = None
-                    invites["redeemed_7d"] = None
-                    errors.append(f"redemptions: {reds.get('reason', 'unavailable')}")
-            except Exception as exc:
-                invites["total_redeemed"] = None
-                invites["redeemed_24h"] = None
-                invites["redeemed_7d"] = None
-                errors.append(f"redemptions: {type(exc).__name__}")
-
-            # By tier
-            try:
-                invites["by_tier"] = _by_tier(cur)
-            except Exception as exc:
-                invites["by_tier"] = []
-                errors.append(f"by_tier: {type(exc).__name__}")
-
-            # Top codes
-            try:
-                invites["top_codes"] = _top_codes(cur)
-            except Exception as exc:
-                invites["top_codes"] = []
-                errors.append(f"top_codes: {type(exc).__name__}")
-
-            # Recent redemptions
-            try:
-                invites["recent_redemptions"] = _recent_redemptions(cur)
-            except Exception as exc:
-                invites["recent_redemptions"] = []
-                errors.append(f"recent_redemptions: {type(exc).__name__}")
+    # Sub-blocks are independent, so each runs concurrently on its own pooled
+    # connection; wall time is the slowest block rather than the sum, and a
+    # failing block cannot abort the others' transaction.
+    futures = {name: _EXECUTOR.submit(_run_block, _BUILDERS[fn]) for name, fn in _BLOCKS}
+
+    # Code counts → flatten into invites; by_tier comes from the same query
+    by_tier: list[dict[str, Any]] = []
+    try:
+        codes = futures["codes"].result()
+        by_tier = codes.get("by_tier", [])
+        if codes.get("available"):
+            invites["total_codes"] = codes["total_codes"]
+            invites["created_24h"] = codes["created_24h"]
+            invites["created_7d"] = codes["created_7d"]
+            invites["active"] = codes["active"]
+            invites["disabled"] = codes["disabled"]
+            invites["expired"] = codes["expired"]
+        else:
+            invites["total_codes"] = None
+            invites["created_24h"] = None
+            invites["created_7d"] = None
+            invites["active"] = None
+            invites["disabled"] = None
+            invites["expired"] = None
+            errors.append(f"codes: {codes.get('reason', 'unavailable')}")
+    except Exception as exc:
+        invites["total_codes"] = None
+        invites["created_24h"] = None
+        invites["created_7d"] = None
+        invites["active"] = None
+        invites["disabled"] = None
+        invites["expired"] = None
+        errors.append(f"codes: {type(exc).__name__}")
+        errors.append(f"by_tier: {type(exc).__name__}")
+
+    # Redemption counts → flatten
+    try:
+        reds = futures["redemptions"].result()
+        if reds.get("available"):
+            invites["total_redeemed"] = reds["total_redeemed"]
+            invites["redeemed_24h"] = reds["redeemed_24h"]
+            invites["redeemed_7d"] = reds["redeemed_7d"]
+        else:
+            invites["total_redeemed"] = None
+            invites["redeemed_24h"] = None
+            invites["redeemed_7d"] = None
+            errors.append(f"redemptions: {reds.get('reason', 'unavailable')}")
+    except Exception as exc:
+        invites["total_redeemed"] = None
+        invites["redeemed_24h"] = None
+        invites["redeemed_7d"] = None
+        errors.append(f"redemptions: {type(exc).__name__}")
+
+    invites["by_tier"] = by_tier
+
+    # Top codes
+    try:
+        invites["top_codes"] = futures["top_codes"].result()
+    except Exception as exc:
+        invites["top_codes"] = []
+        errors.append(f"top_codes: {type(exc).__name__}")
+
+    # Recent redemptions
+    try:
+        invites["recent_redemptions"] = futures["recent_redemptions"].result()
+    except Exception as exc:
+        invites["recent_redemptions"] = []
+        errors.append(f"recent_redemptions: {type(exc).__name__}")
 
     result: dict[str, Any] = {
         "ok": True,
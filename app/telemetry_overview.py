@@ -7,36 +7,72 @@ is unaffected.  No migrations required.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
+
+from .db import execute_prepared, get_conn
+from .telemetry_common import CONN_SLOTS, existing_tables, invalidate_on_missing_table, now_iso, unavailable
+from .ttl_cache import ttl_cache
+
+
+_TABLES = (
+    "service_heartbeats", "user_tiers", "user_sessions", "invite_codes",
+    "invite_redemptions", "menu_toggle_events", "metrics_api_calls",
+    "telemetry_events", "alert_lifecycle", "abuse_rollup_hourly",
+)
+
+# One scan per table; each window is a FILTER on the same rows.
+_SQL_INVITE_COUNTS = (
+    "SELECT COUNT(*), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '7 days') "
+    "FROM invite_codes"
+)
+
+_SQL_REDEMPTION_COUNTS = (
+    "SELECT COUNT(*), "
+    "  COUNT(*) FILTER (WHERE redeemed_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) FILTER (WHERE redeemed_at > NOW() - INTERVAL '7 days') "
+    "FROM invite_redemptions"
+)
+
+# Each side is a single-row aggregate, so the cross join is one row.
+_SQL_INVITE_AND_REDEMPTION_COUNTS = (
+    f"SELECT c.*, r.* FROM ({_SQL_INVITE_COUNTS}) c "
+    f"CROSS JOIN ({_SQL_REDEMPTION_COUNTS}) r"
+)
+
+# Totals plus the top event types (built server-side as one JSON object,
+# ordered by count, decoded by orjson) in one round trip.
+_SQL_TELEMETRY_24H = (
+    "SELECT COUNT(*), COUNT(DISTINCT user_id), ("
+    "  SELECT json_object_agg(event_type, n ORDER BY n DESC) FROM ("
+    "    SELECT COALESCE(event_type, 'unknown') AS event_type, COUNT(*) AS n "
+    "    FROM telemetry_events "
+    "    WHERE created_at > NOW() - INTERVAL '24 hours' "
+    "    GROUP BY event_type ORDER BY COUNT(*) DESC LIMIT 10"
+    "  ) t"
+    ") "
+    "FROM telemetry_events "
+    "WHERE created_at > NOW() - INTERVAL '24 hours'"
+)
 
-from .db import get_conn
-
-
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
 
+# -- Section builders --------------------------------------------------------
 
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
+_SQL_SERVICE_HEALTH = (
+    "SELECT service_name, last_seen_at FROM service_heartbeats "
+    "ORDER BY service_name"
+)
 
 
-# -- Section builders --------------------------------------------------------
-
-def _service_health(cur: Any) -> dict[str, Any]:
+def _service_health(cur: Any, existing: set[str]) -> dict[str, Any]:
     """Reuses service_heartbeats directly (same logic as health_services.py)."""
-    if not _table_exists(cur, "service_heartbeats"):
-        return _unavailable()
+    if "service_heartbeats" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT service_name, last_seen_at FROM service_heartbeats "
-        "ORDER BY service_name"
-    )
+    execute_prepared(cur, _SQL_SERVICE_HEALTH)
     rows = cur.fetchall()
     now = datetime.now(timezone.utc)
     total = len(rows)
@@ -57,25 +93,30 @@ def _service_health(cur: Any) -> dict[str, Any]:
     }
 
 
-def _users_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "user_tiers"):
-        return _unavailable()
+_SQL_USER_TIERS = (
+    "SELECT COALESCE(tier, 'unknown'), COUNT(*) "
+    "FROM user_tiers GROUP BY tier ORDER BY COUNT(*) DESC"
+)
+
+_SQL_ACTIVE_USERS_24H = (
+    "SELECT COUNT(DISTINCT user_id) FROM user_sessions "
+    "WHERE last_event_at > NOW() - INTERVAL '24 hours'"
+)
 
-    cur.execute("SELECT COUNT(*) FROM user_tiers")
-    total_users = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COALESCE(tier, 'unknown'), COUNT(*) "
-        "FROM user_tiers GROUP BY tier ORDER BY COUNT(*) DESC"
-    )
-    tier_distribution = {row[0]: row[1] for row in cur.fetchall()}
+def _users_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "user_tiers" not in existing:
+        return unavailable()
+
+    # The total is the sum of the per-tier counts; no separate COUNT(*) pass.
+    execute_prepared(cur, _SQL_USER_TIERS)
+    rows = cur.fetchall()
+    total_users = sum(n for _, n in rows)
+    tier_distribution = dict(rows)
 
     active_24h = None
-    if _table_exists(cur, "user_sessions"):
-        cur.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM user_sessions "
-            "WHERE last_event_at > NOW() - INTERVAL '24 hours'"
-        )
+    if "user_sessions" in existing:
+        execute_prepared(cur, _SQL_ACTIVE_USERS_24H)
         active_24h = cur.fetchone()[0]
 
     return {
@@ -86,41 +127,20 @@ def _users_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _invites_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "invite_codes"):
-        return _unavailable()
-
-    cur.execute("SELECT COUNT(*) FROM invite_codes")
-    total_codes = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    created_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM invite_codes "
-        "WHERE created_at > NOW() - INTERVAL '7 days'"
-    )
-    created_7d = cur.fetchone()[0]
-
-    redeemed_total = None
-    redeemed_24h = None
-    redeemed_7d = None
-    if _table_exists(cur, "invite_redemptions"):
-        cur.execute("SELECT COUNT(*) FROM invite_redemptions")
-        redeemed_total = cur.fetchone()[0]
-        cur.execute(
-            "SELECT COUNT(*) FROM invite_redemptions "
-            "WHERE redeemed_at > NOW() - INTERVAL '24 hours'"
-        )
-        redeemed_24h = cur.fetchone()[0]
-        cur.execute(
-            "SELECT COUNT(*) FROM invite_redemptions "
-            "WHERE redeemed_at > NOW() - INTERVAL '7 days'"
-        )
-        redeemed_7d = cur.fetchone()[0]
+def _invites_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "invite_codes" not in existing:
+        return unavailable()
+
+    # Both tables' counts come back in one statement (one round trip) when
+    # invite_redemptions exists; the redeemed_* figures stay None otherwise.
+    if "invite_redemptions" in existing:
+        execute_prepared(cur, _SQL_INVITE_AND_REDEMPTION_COUNTS)
+        (total_codes, created_24h, created_7d,
+         redeemed_total, redeemed_24h, redeemed_7d) = cur.fetchone()
+    else:
+        execute_prepared(cur, _SQL_INVITE_COUNTS)
+        total_codes, created_24h, created_7d = cur.fetchone()
+        redeemed_total = redeemed_24h = redeemed_7d = None
 
     return {
         "available": True,
@@ -133,27 +153,22 @@ def _invites_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _menu_toggles_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "menu_toggle_events"):
-        return _unavailable()
+_SQL_MENU_TOGGLES = (
+    "SELECT COUNT(*) FILTER (WHERE ts > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*), "
+    "  COUNT(DISTINCT user_id) FILTER (WHERE ts > NOW() - INTERVAL '24 hours') "
+    "FROM menu_toggle_events "
+    "WHERE ts > NOW() - INTERVAL '7 days'"
+)
 
-    cur.execute(
-        "SELECT COUNT(*) FROM menu_toggle_events "
-        "WHERE ts > NOW() - INTERVAL '24 hours'"
-    )
-    events_24h = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COUNT(*) FROM menu_toggle_events "
-        "WHERE ts > NOW() - INTERVAL '7 days'"
-    )
-    events_7d = cur.fetchone()[0]
+def _menu_toggles_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "menu_toggle_events" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COUNT(DISTINCT user_id) FROM menu_toggle_events "
-        "WHERE ts > NOW() - INTERVAL '24 hours'"
-    )
-    users_24h = cur.fetchone()[0]
+    # One pass over the 7d window; the 24h figures are FILTERs on the same rows.
+    execute_prepared(cur, _SQL_MENU_TOGGLES)
+    events_24h, events_7d, users_24h = cur.fetchone()
 
     return {
         "available": True,
@@ -163,33 +178,33 @@ def _menu_toggles_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _api_usage_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "metrics_api_calls"):
-        return _unavailable()
-
-    cur.execute(
-        "SELECT COUNT(*), "
-        "  COALESCE(SUM(CASE WHEN failure_count > 0 THEN failure_count ELSE 0 END), 0), "
-        "  COALESCE(AVG(avg_latency_ms), 0) "
-        "FROM metrics_api_calls "
-        "WHERE hour > NOW() - INTERVAL '24 hours'"
-    )
-    row = cur.fetchone()
-    total_rows = row[0]
-    total_failures = int(row[1])
-    avg_latency = round(float(row[2]), 1)
-
-    cur.execute(
-        "SELECT COALESCE(api_name, 'unknown'), "
-        "  SUM(COALESCE(success_count, 0) + COALESCE(failure_count, 0)) AS calls, "
-        "  SUM(COALESCE(failure_count, 0)) AS errors "
-        "FROM metrics_api_calls "
-        "WHERE hour > NOW() - INTERVAL '24 hours' "
-        "GROUP BY api_name ORDER BY calls DESC LIMIT 20"
-    )
-    by_provider = {}
-    for api_name, calls, errors in cur.fetchall():
-        by_provider[api_name] = {"calls": int(calls), "errors": int(errors)}
+_SQL_API_USAGE = (
+    "SELECT COALESCE(api_name, 'unknown'), "
+    "  SUM(COALESCE(success_count, 0) + COALESCE(failure_count, 0))::bigint AS calls, "
+    "  SUM(COALESCE(failure_count, 0))::bigint AS errors, "
+    "  SUM(COUNT(*)) OVER ()::bigint, "
+    "  SUM(SUM(CASE WHEN failure_count > 0 THEN failure_count ELSE 0 END)) OVER ()::bigint, "
+    "  SUM(SUM(avg_latency_ms)) OVER () / NULLIF(SUM(COUNT(avg_latency_ms)) OVER (), 0) "
+    "FROM metrics_api_calls "
+    "WHERE hour > NOW() - INTERVAL '24 hours' "
+    "GROUP BY api_name ORDER BY calls DESC LIMIT 20"
+)
+
+
+def _api_usage_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "metrics_api_calls" not in existing:
+        return unavailable()
+
+    # Per-provider rows and the window totals in one statement: the window
+    # aggregates run over all groups before ORDER BY/LIMIT trims the rows.
+    execute_prepared(cur, _SQL_API_USAGE)
+    rows = cur.fetchall()
+    total_rows, total_failures, avg_latency = 0, 0, 0.0
+    if rows:
+        total_rows = rows[0][3]
+        total_failures = rows[0][4]
+        avg_latency = round(float(rows[0][5] or 0), 1)
+    by_provider = {r[0]: {"calls": r[1], "errors": r[2]} for r in rows}
 
     return {
         "available": True,
@@ -200,29 +215,13 @@ def _api_usage_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _telemetry_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "telemetry_events"):
-        return _unavailable()
+def _telemetry_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "telemetry_events" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COUNT(*) FROM telemetry_events "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    events_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(DISTINCT user_id) FROM telemetry_events "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    active_users_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COALESCE(event_type, 'unknown'), COUNT(*) "
-        "FROM telemetry_events "
-        "WHERE created_at > NOW() - INTERVAL '24 hours' "
-        "GROUP BY event_type ORDER BY COUNT(*) DESC LIMIT 10"
-    )
-    top_events = {row[0]: row[1] for row in cur.fetchall()}
+    execute_prepared(cur, _SQL_TELEMETRY_24H)
+    events_24h, active_users_24h, top_events = cur.fetchone()
+    top_events = top_events or {}
 
     return {
         "available": True,
@@ -232,17 +231,22 @@ def _telemetry_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _alerts_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "alert_lifecycle"):
-        return _unavailable()
+_SQL_ALERTS_24H = (
+    "SELECT json_object_agg(event_type, n) FROM ("
+    "  SELECT COALESCE(event_type, 'unknown') AS event_type, COUNT(*) AS n "
+    "  FROM alert_lifecycle "
+    "  WHERE created_at > NOW() - INTERVAL '24 hours' "
+    "  GROUP BY event_type"
+    ") t"
+)
+
 
-    cur.execute(
-        "SELECT COALESCE(event_type, 'unknown'), COUNT(*) "
-        "FROM alert_lifecycle "
-        "WHERE created_at > NOW() - INTERVAL '24 hours' "
-        "GROUP BY event_type"
-    )
-    breakdown = {row[0]: row[1] for row in cur.fetchall()}
+def _alerts_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "alert_lifecycle" not in existing:
+        return unavailable()
+
+    execute_prepared(cur, _SQL_ALERTS_24H)
+    breakdown = cur.fetchone()[0] or {}
     fired = breakdown.get("fired", 0)
 
     return {
@@ -252,20 +256,23 @@ def _alerts_summary(cur: Any) -> dict[str, Any]:
     }
 
 
-def _abuse_summary(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "abuse_rollup_hourly"):
-        return _unavailable()
+_SQL_ABUSE_24H = (
+    "SELECT COALESCE(SUM(allows), 0)::bigint, COALESCE(SUM(denies), 0)::bigint "
+    "FROM abuse_rollup_hourly "
+    "WHERE hour_ts > NOW() - INTERVAL '24 hours'"
+)
+
+
+def _abuse_summary(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "abuse_rollup_hourly" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COALESCE(SUM(allows), 0), COALESCE(SUM(denies), 0) "
-        "FROM abuse_rollup_hourly "
-        "WHERE hour_ts > NOW() - INTERVAL '24 hours'"
-    )
-    row = cur.fetchone()
+    execute_prepared(cur, _SQL_ABUSE_24H)
+    allows, denies = cur.fetchone()
     return {
         "available": True,
-        "allows_24h": int(row[0]),
-        "denies_24h": int(row[1]),
+        "allows_24h": allows,
+        "denies_24h": denies,
     }
 
 
@@ -283,22 +290,44 @@ _SECTIONS = [
 ]
 
 
+def _run_section(builder: Callable[[Any, set[str]], dict[str, Any]]) -> dict[str, Any]:
+    """Run one section on its own pooled, read-only connection."""
+    with CONN_SLOTS, get_conn() as conn:
+        conn.set_session(readonly=True)
+        with conn.cursor() as cur:
+            try:
+                return builder(cur, existing_tables(cur, _TABLES))
+            except Exception as exc:
+                invalidate_on_missing_table(exc)
+                raise
+
+
+# Shared across requests; worker threads are started on first use and reused.
+# Four workers run the eight (short) sections in two waves, so one rebuild
+# holds at most four connections.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="telemetry-overview")
+
+
+@ttl_cache(seconds=30)
 def build_telemetry_overview() -> dict[str, Any]:
     """Build the overview payload. Each section is independently fault-tolerant."""
     result: dict[str, Any] = {
         "ok": True,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": now_iso(),
     }
     errors: list[str] = []
 
-    with get_conn() as conn:
-        with conn.cursor() as cur:
-            for name, builder in _SECTIONS:
-                try:
-                    result[name] = builder(cur)
-                except Exception as exc:
-                    result[name] = _unavailable(f"query error: {type(exc).__name__}")
-                    errors.append(f"{name}: {exc}")
+    # Sections read disjoint tables, so each runs concurrently on its own
+    # pooled connection; wall time is the slowest section rather than the sum,
+    # and a failing query cannot abort the other sections' transaction.  All
+    # telemetry blocks share CONN_SLOTS, so they never hold the whole pool.
+    futures = [(name, _EXECUTOR.submit(_run_section, builder)) for name, builder in _SECTIONS]
+    for name, future in futures:
+        try:
+            result[name] = future.result()
+        except Exception as exc:
+            result[name] = unavailable(f"query error: {type(exc).__name__}")
+            errors.append(f"{name}: {exc}")
 
     if errors:
         result["_errors"] = errors
@@ -5,141 +5,131 @@ Each sub-block is independently fault-tolerant.  No migrations required.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any
 
-from .db import get_conn
+from .db import execute_prepared, get_conn
+from .telemetry_common import existing_tables, now_iso, unavailable
+from .ttl_cache import ttl_cache
 
 
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
+_TABLES = ("paper_accounts_v3", "paper_positions", "paper_trades")
 
 
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
+_SQL_ACCOUNTS = (
+    "SELECT COUNT(*) FILTER (WHERE is_active), COUNT(*) FROM paper_accounts_v3"
+)
 
 
-def _accounts(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "paper_accounts_v3"):
-        return _unavailable()
+def _accounts(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "paper_accounts_v3" not in existing:
+        return unavailable()
 
-    cur.execute(
-        "SELECT COUNT(*) FILTER (WHERE is_active), COUNT(*) FROM paper_accounts_v3"
-    )
+    execute_prepared(cur, _SQL_ACCOUNTS)
     active, total = cur.fetchone()
     return {
         "available": True,
-        "active": int(active or 0),
-        "total": int(total or 0),
+        "active": active,
+        "total": total,
     }
 
 
-def _positions(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "paper_positions"):
-        return _unavailable()
+_SQL_POSITIONS = (
+    "SELECT COUNT(*) FILTER (WHERE status = 'open'), COUNT(*) FROM paper_positions"
+)
 
-    cur.execute("SELECT COUNT(*) FROM paper_positions WHERE status = 'open'")
-    open_pos = cur.fetchone()[0]
 
-    cur.execute("SELECT COUNT(*) FROM paper_positions")
-    total = cur.fetchone()[0]
+def _positions(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "paper_positions" not in existing:
+        return unavailable()
+
+    execute_prepared(cur, _SQL_POSITIONS)
+    open_pos, total = cur.fetchone()
 
     return {
         "available": True,
-        "open": int(open_pos or 0),
-        "total": int(total or 0),
+        "open": open_pos,
+        "total": total,
     }
 
 
-def _trades(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "paper_trades"):
-        return _unavailable()
-
-    cur.execute(
-        "SELECT COUNT(*) FROM paper_trades "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    trades_24h = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM paper_trades "
-        "WHERE created_at > NOW() - INTERVAL '7 days'"
-    )
-    trades_7d = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT "
-        "  COUNT(*) FILTER (WHERE net_pnl_usdt > 0), "
-        "  COUNT(*) FILTER (WHERE net_pnl_usdt < 0), "
-        "  COUNT(*), "
-        "  COALESCE(SUM(net_pnl_usdt), 0) "
-        "FROM paper_trades "
-        "WHERE created_at > NOW() - INTERVAL '30 days'"
-    )
-    wins, losses, total_30d, pnl_30d = cur.fetchone()
+# The 30d aggregates and the per-account rollup in one pass: the () grouping
+# set is the grand-total row (ordered first), the (account_id) rows are the top
+# accounts by PnL.  The 24h/7d counts are FILTERs on the same rows.
+_SQL_TRADES_GROUPED = (
+    "SELECT GROUPING(account_id) AS is_total, account_id, "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') AS n_24h, "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '7 days') AS n_7d, "
+    "  COUNT(*) FILTER (WHERE net_pnl_usdt > 0) AS wins, "
+    "  COUNT(*) FILTER (WHERE net_pnl_usdt < 0) AS losses, "
+    "  COUNT(*) AS n_30d, "
+    "  COALESCE(SUM(net_pnl_usdt), 0) AS pnl, "
+    "  SUM(net_pnl_usdt) AS pnl_order "
+    "FROM paper_trades "
+    "WHERE created_at > NOW() - INTERVAL '30 days' "
+    "GROUP BY GROUPING SETS ((account_id), ()) "
+    "ORDER BY is_total DESC, pnl_order DESC "
+    "LIMIT 11"
+)
+
+# Owners are looked up for the (at most ten) top accounts only.
+_SQL_TRADES_WITH_OWNERS = (
+    f"SELECT g.*, a.user_id FROM ({_SQL_TRADES_GROUPED}) g "
+    "LEFT JOIN LATERAL ("
+    "  SELECT user_id FROM paper_accounts_v3 "
+    "  WHERE account_id = g.account_id LIMIT 1"
+    ") a ON g.is_total = 0 "
+    "ORDER BY g.is_total DESC, g.pnl_order DESC"
+)
+
+_SQL_TRADES = f"SELECT g.*, NULL FROM ({_SQL_TRADES_GROUPED}) g ORDER BY g.is_total DESC, g.pnl_order DESC"
+
+
+def _trades(cur: Any, existing: set[str]) -> dict[str, Any]:
+    """30d trade aggregates (with 24h/7d counts) and the top 10 accounts by PnL."""
+    if "paper_trades" not in existing:
+        return unavailable()
+
+    execute_prepared(cur, _SQL_TRADES_WITH_OWNERS if "paper_accounts_v3" in existing else _SQL_TRADES)
+    rows = cur.fetchall()
+    _, _, trades_24h, trades_7d, wins, losses, total_30d, pnl_30d, _, _ = rows[0]
 
     return {
         "available": True,
-        "trades_24h": int(trades_24h or 0),
-        "trades_7d": int(trades_7d or 0),
-        "trades_30d": int(total_30d or 0),
-        "wins_30d": int(wins or 0),
-        "losses_30d": int(losses or 0),
+        "trades_24h": trades_24h,
+        "trades_7d": trades_7d,
+        "trades_30d": total_30d,
+        "wins_30d": wins,
+        "losses_30d": losses,
         "pnl_30d": round(float(pnl_30d or 0), 2),
+        "top_accounts": [
+            {
+                "account_id": str(account_id),
+                "user_id": user_id,
+                "trades": trades,
+                "pnl": round(float(pnl or 0), 2),
+            }
+            for _, account_id, _, _, _, _, trades, pnl, _, user_id in rows[1:]
+        ],
     }
 
 
-def _top_accounts(cur: Any) -> list[dict[str, Any]]:
-    if not _table_exists(cur, "paper_trades"):
-        return []
-
-    has_accounts = _table_exists(cur, "paper_accounts_v3")
-
-    if has_accounts:
-        cur.execute(
-            "SELECT t.account_id, a.user_id, "
-            "  COUNT(*), COALESCE(SUM(t.net_pnl_usdt), 0) "
-            "FROM paper_trades t "
-            "LEFT JOIN paper_accounts_v3 a ON a.account_id = t.account_id "
-            "WHERE t.created_at > NOW() - INTERVAL '30 days' "
-            "GROUP BY t.account_id, a.user_id "
-            "ORDER BY SUM(t.net_pnl_usdt) DESC LIMIT 10"
-        )
-    else:
-        cur.execute(
-            "SELECT account_id, NULL, "
-            "  COUNT(*), COALESCE(SUM(net_pnl_usdt), 0) "
-            "FROM paper_trades "
-            "WHERE created_at > NOW() - INTERVAL '30 days' "
-            "GROUP BY account_id "
-            "ORDER BY SUM(net_pnl_usdt) DESC LIMIT 10"
-        )
-
-    return [
-        {
-            "account_id": str(row[0]),
-            "user_id": row[1],
-            "trades": int(row[2]),
-            "pnl": round(float(row[3] or 0), 2),
-        }
-        for row in cur.fetchall()
-    ]
-
-
+@ttl_cache(seconds=30)
 def build_telemetry_paper() -> dict[str, Any]:
-    now = datetime.now(timezone.utc).isoformat()
+    now = now_iso()
     paper: dict[str, Any] = {}
     errors: list[str] = []
 
     with get_conn() as conn:
         with conn.cursor() as cur:
+            # One batched existence probe (cached) instead of one per section.
+            try:
+                existing = existing_tables(cur, _TABLES)
+            except Exception:
+                conn.rollback()
+                existing = set()
+
             try:
-                accts = _accounts(cur)
+                accts = _accounts(cur, existing)
                 if accts.get("available"):
                     paper["accounts_active"] = accts["active"]
                     paper["accounts_total"] = accts["total"]
@@ -153,7 +143,7 @@ def build_telemetry_paper() -> dict[str, Any]:
                 errors.append(f"accounts: {type(exc).__name__}")
 
             try:
-                pos = _positions(cur)
+                pos = _positions(cur, existing)
                 if pos.get("available"):
                     paper["positions_open"] = pos["open"]
                     paper["positions_total"] = pos["total"]
@@ -166,8 +156,11 @@ def build_telemetry_paper() -> dict[str, Any]:
                 paper["positions_total"] = None
                 errors.append(f"positions: {type(exc).__name__}")
 
+            # top_accounts comes from the same grouped query as the trade counts.
+            top_accounts: list[dict[str, Any]] = []
             try:
-                tr = _trades(cur)
+                tr = _trades(cur, existing)
+                top_accounts = tr.get("top_accounts", [])
                 if tr.get("available"):
                     paper["trades_24h"] = tr["trades_24h"]
                     paper["trades_7d"] = tr["trades_7d"]
@@ -191,12 +184,8 @@ def build_telemetry_paper() -> dict[str, Any]:
                 paper["losses_30d"] = None
                 paper["pnl_30d"] = None
                 errors.append(f"trades: {type(exc).__name__}")
-
-            try:
-                paper["top_accounts"] = _top_accounts(cur)
-            except Exception as exc:
-                paper["top_accounts"] = []
                 errors.append(f"top_accounts: {type(exc).__name__}")
+            paper["top_accounts"] = top_accounts
 
     result: dict[str, Any] = {"ok": True, "generated_at": now, "paper": paper}
     if errors:
@@ -5,91 +5,90 @@ Each sub-block is independently fault-tolerant.  No migrations required.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any
 
-from .db import get_conn
+from .db import execute_prepared, get_conn
+from .telemetry_common import existing_tables, iso, now_iso, unavailable
+from .ttl_cache import ttl_cache
 
 
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
+_TABLES = ("scanner_run_meta", "scanner_cache")
 
 
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
+_SQL_SCANNER_RUNS = (
+    "SELECT scanner || ':' || timeframe, last_run_at, "
+    "  last_run_duration_ms, signals_found, status, "
+    "  EXTRACT(EPOCH FROM NOW() - last_run_at)::float8 "
+    "FROM scanner_run_meta "
+    "ORDER BY last_run_at DESC NULLS LAST"
+)
 
 
-def _iso(val: Any) -> str | None:
-    if val is None:
-        return None
-    if hasattr(val, "isoformat"):
-        return val.isoformat()
-    return str(val)
+def _scanner_runs(cur: Any, existing: set[str]) -> dict[str, Any]:
+    if "scanner_run_meta" not in existing:
+        return unavailable()
 
-
-def _scanner_runs(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "scanner_run_meta"):
-        return _unavailable()
-
-    cur.execute(
-        "SELECT scanner, timeframe, last_run_at, "
-        "  last_run_duration_ms, signals_found, status "
-        "FROM scanner_run_meta "
-        "ORDER BY last_run_at DESC NULLS LAST"
-    )
-    scanners = []
-    for scanner, timeframe, run_at, duration_ms, signals, status in cur.fetchall():
-        age_s = (datetime.now(timezone.utc) - run_at).total_seconds() if run_at else None
-        scanners.append({
-            "scanner_id": f"{scanner}:{timeframe}",
-            "last_run_at": _iso(run_at),
+    # The id and the age are computed server-side (age is NULL if never run).
+    execute_prepared(cur, _SQL_SCANNER_RUNS)
+    scanners = [
+        {
+            "scanner_id": scanner_id,
+            "last_run_at": iso(run_at),
             "duration_s": round(float(duration_ms or 0) / 1000.0, 2),
             "result_count": int(signals or 0),
             "status": status or "unknown",
             "age_s": round(age_s, 1) if age_s is not None else None,
-        })
+        }
+        for scanner_id, run_at, duration_ms, signals, status, age_s in cur
+    ]
 
     return {"available": True, "scanners": scanners}
 
 
-def _scanner_cache(cur: Any) -> list[dict[str, Any]]:
-    if not _table_exists(cur, "scanner_cache"):
+_SQL_SCANNER_CACHE = (
+    "SELECT scanner || ':' || timeframe AS cache_key, "
+    "  MAX(scanned_at) AS updated_at, "
+    "  EXTRACT(EPOCH FROM NOW() - MAX(scanned_at)) AS age_s, "
+    "  COUNT(*) AS entries "
+    "FROM scanner_cache "
+    "GROUP BY scanner, timeframe "
+    "ORDER BY scanner, timeframe"
+)
+
+
+def _scanner_cache(cur: Any, existing: set[str]) -> list[dict[str, Any]]:
+    if "scanner_cache" not in existing:
         return []
 
-    cur.execute(
-        "SELECT scanner || ':' || timeframe AS cache_key, "
-        "  MAX(scanned_at) AS updated_at, "
-        "  EXTRACT(EPOCH FROM NOW() - MAX(scanned_at)) AS age_s, "
-        "  COUNT(*) AS entries "
-        "FROM scanner_cache "
-        "GROUP BY scanner, timeframe "
-        "ORDER BY scanner, timeframe"
-    )
+    execute_prepared(cur, _SQL_SCANNER_CACHE)
     return [
         {
             "cache_key": row[0],
-            "updated_at": _iso(row[1]),
+            "updated_at": iso(row[1]),
             "age_s": round(float(row[2] or 0), 1),
-            "entries": int(row[3]),
+            "entries": row[3],
         }
         for row in cur.fetchall()
     ]
 
 
+@ttl_cache(seconds=30)
 def build_telemetry_scanners() -> dict[str, Any]:
-    now = datetime.now(timezone.utc).isoformat()
+    now = now_iso()
     result_scanners: dict[str, Any] = {}
     errors: list[str] = []
 
     with get_conn() as conn:
         with conn.cursor() as cur:
+            # One batched existence probe (cached) instead of one per section.
+            try:
+                existing = existing_tables(cur, _TABLES)
+            except Exception:
+                conn.rollback()
+                existing = set()
+
             try:
-                runs = _scanner_runs(cur)
+                runs = _scanner_runs(cur, existing)
                 if runs.get("available"):
                     result_scanners["scanners"] = runs["scanners"]
                 else:
@@ -101,7 +100,7 @@ def build_telemetry_scanners() -> dict[str, Any]:
                 errors.append(f"scanners: {type(exc).__name__}")
 
             try:
-                result_scanners["cache"] = _scanner_cache(cur)
+                result_scanners["cache"] = _scanner_cache(cur, existing)
             except Exception as exc:
                 conn.rollback()
                 result_scanners["cache"] = []
@@ -9,6 +9,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from .db import get_conn
+from .telemetry_common import table_exists
 
 # ---------------------------------------------------------------------------
 # Constants (must match scripts/ta_ops_health.py)
@@ -39,15 +40,6 @@ EXPECTED_COUNT = len(EXPECTED_SET)  # 15
 STALE_THRESHOLD_S = 8100  # 2h 15m
 
 
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
-
-
 def _unavailable(reason: str = "table not found") -> dict[str, Any]:
     return {"available": False, "reason": reason}
 
@@ -74,7 +66,7 @@ GROUP BY asset, artifact_id
 
 
 def _artifact_parity(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "ts_artifact_observations"):
+    if not table_exists(cur, "ts_artifact_observations"):
         return _unavailable()
 
     cur.execute(ARTIFACT_QUERY)
@@ -142,7 +134,7 @@ ORDER BY horizon
 
 
 def _rollup_freshness(cur: Any) -> dict[str, Any]:
-    if not _table_exists(cur, "ta_scanner_rollups_daily"):
+    if not table_exists(cur, "ta_scanner_rollups_daily"):
         return _unavailable()
 
     cur.execute(ROLLUP_QUERY)
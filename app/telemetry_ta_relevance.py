@@ -10,15 +10,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from .db import get_conn
-
-
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
-    )
-    return cur.fetchone() is not None
+from .telemetry_common import table_exists
 
 
 def _iso(val: Any) -> str | None:
@@ -63,7 +55,7 @@ def build_telemetry_ta_relevance(
 
     with get_conn() as conn:
         with conn.cursor() as cur:
-            if not _table_exists(cur, "ta_scanner_relevance_daily"):
+            if not table_exists(cur, "ta_scanner_relevance_daily"):
                 return {
                     "ok": False,
                     "generated_at": now,
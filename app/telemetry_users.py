@@ -2,167 +2,250 @@
 
 Each sub-block is independently fault-tolerant: if a table or column is missing
 the block returns ``available: false`` and the rest of the payload is unaffected.
-No migrations required.
+No migrations required.  Timestamps are left as datetime objects; the route
+serializes with orjson.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
-
-from .db import get_conn
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from typing import Any, Callable
+
+from .db import execute_prepared, get_conn
+from .telemetry_common import CONN_SLOTS, existing_tables, invalidate_on_missing_table, now_iso, unavailable
+from .ttl_cache import ttl_cache
+
+
+_TABLES = ("user_tiers", "user_sessions", "user_last_seen", "invite_redemptions", "invite_codes")
+
+
+# One scan; each window is a FILTER on the same rows.
+_SQL_COUNTS = (
+    "SELECT COUNT(*), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '7 days') "
+    "FROM user_tiers"
+)
+
+# One pass over the 7d window, grouped per user: a GROUP BY hash aggregate
+# can run on parallel workers, COUNT(DISTINCT) is a serial sort.  A user
+# was active in the last 24h iff their latest event in the window was.
+_SQL_ACTIVITY = (
+    "SELECT COUNT(*) FILTER (WHERE last_event_at > NOW() - INTERVAL '24 hours'), "
+    "  COUNT(*) "
+    "FROM ("
+    "  SELECT user_id, MAX(last_event_at) AS last_event_at "
+    "  FROM user_sessions "
+    "  WHERE last_event_at > NOW() - INTERVAL '7 days' "
+    "  GROUP BY user_id"
+    ") s"
+)
+
+# Above this many rows (planner estimate from pg_class.reltuples, so no extra
+# scan) the tier distribution is estimated from a 1% block sample.
+_TIERS_SAMPLE_MIN_ROWS = 1_000_000
+
+# Built server-side as one JSON array (ordered by count), decoded by orjson.
+# Only one branch of the UNION ALL runs: the other's one-time filter is false.
+# The table is looked up at run time (a ::regclass literal would be bound once,
+# at PREPARE), and a missing estimate - no pg_class row, or reltuples -1 for a
+# never-analyzed table - keeps it exact.
+_SQL_TIERS = (
+    "WITH est AS ("
+    f"  SELECT COALESCE(bool_or(reltuples >= {_TIERS_SAMPLE_MIN_ROWS}), false) AS sampled "
+    "  FROM pg_class WHERE oid = to_regclass('public.user_tiers')"
+    "), t AS ("
+    "  SELECT COALESCE(tier, 'unknown') AS tier, COUNT(*) AS n "
+    "  FROM user_tiers WHERE NOT (SELECT sampled FROM est) GROUP BY tier "
+    "  UNION ALL "
+    "  SELECT COALESCE(tier, 'unknown'), COUNT(*) * 100 "
+    "  FROM user_tiers TABLESAMPLE SYSTEM (1) WHERE (SELECT sampled FROM est) GROUP BY tier"
+    ") "
+    "SELECT json_agg(json_build_object('tier', tier, 'count', n) ORDER BY n DESC), "
+    "  (SELECT sampled FROM est) "
+    "FROM t"
+)
+
+# Latest session per user.  When the schema owner maintains the optional
+# user_last_seen rollup (see ADMIN_TELEMETRY_PLAN.md) it is read instead of
+# aggregating user_sessions; otherwise user_sessions is aggregated once (hash
+# aggregate) rather than probed per user via LATERAL.
+_LAST_SEEN_FROM_SESSIONS = (
+    "SELECT user_id, MAX(last_event_at) AS last_event_at "
+    "FROM user_sessions GROUP BY user_id"
+)
+_LAST_SEEN_FROM_ROLLUP = "SELECT user_id, last_event_at FROM user_last_seen"
+
+
+def _sql_buckets(last_seen: str) -> str:
+    # Left join user_tiers onto the latest session per user.  The bucket bounds
+    # are computed once (CROSS JOIN) and each bucket is a FILTERed count, so no
+    # per-row CASE/interval arithmetic.
+    return (
+        f"WITH s AS ({last_seen}) "
+        "SELECT "
+        "  COUNT(*) FILTER (WHERE s.last_event_at > b.t24), "
+        "  COUNT(*) FILTER (WHERE s.last_event_at > b.t7d AND s.last_event_at <= b.t24), "
+        "  COUNT(*) FILTER (WHERE s.last_event_at <= b.t7d), "
+        "  COUNT(*) FILTER (WHERE s.last_event_at IS NULL) "
+        "FROM user_tiers ut "
+        "LEFT JOIN s ON s.user_id = ut.user_id "
+        "CROSS JOIN ("
+        "  SELECT NOW() - INTERVAL '24 hours' AS t24, NOW() - INTERVAL '7 days' AS t7d"
+        ") b"
+    )
 
 
-def _table_exists(cur: Any, name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.tables "
-        "WHERE table_schema = 'public' AND table_name = %s",
-        (name,),
+def _sql_fused(last_seen: str) -> str:
+    # counts, activity and buckets are single-row aggregates over user_tiers
+    # and user_sessions: fused, they come back as one row in one round trip.
+    return (
+        f"SELECT * FROM ({_SQL_COUNTS}) c "
+        f"CROSS JOIN ({_SQL_ACTIVITY}) a "
+        f"CROSS JOIN ({_sql_buckets(last_seen)}) b"
     )
-    return cur.fetchone() is not None
 
 
-def _unavailable(reason: str = "table not found") -> dict[str, Any]:
-    return {"available": False, "reason": reason}
+_SQL_BUCKETS = _sql_buckets(_LAST_SEEN_FROM_SESSIONS)
+_SQL_BUCKETS_FROM_ROLLUP = _sql_buckets(_LAST_SEEN_FROM_ROLLUP)
+_SQL_FUSED = _sql_fused(_LAST_SEEN_FROM_SESSIONS)
+_SQL_FUSED_FROM_ROLLUP = _sql_fused(_LAST_SEEN_FROM_ROLLUP)
 
 
-def _iso(val: Any) -> str | None:
-    """Safely convert a datetime-ish value to ISO-8601 string."""
-    if val is None:
-        return None
-    if hasattr(val, "isoformat"):
-        return val.isoformat()
-    return str(val)
+# -- Sub-block builders ------------------------------------------------------
 
+def _counts_result(row: tuple[Any, ...]) -> dict[str, Any]:
+    total, new_24h, new_7d = row
+    return {"available": True, "total_users": total, "new_24h": new_24h, "new_7d": new_7d}
 
-# -- Sub-block builders ------------------------------------------------------
 
-def _counts(cur: Any) -> dict[str, Any]:
-    """total_users, new_24h, new_7d."""
-    if not _table_exists(cur, "user_tiers"):
-        return _unavailable()
+def _activity_result(row: tuple[Any, ...]) -> dict[str, Any]:
+    active_24h, active_7d = row
+    return {"available": True, "active_24h": active_24h, "active_7d": active_7d}
 
-    cur.execute("SELECT COUNT(*) FROM user_tiers")
-    total = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COUNT(*) FROM user_tiers "
-        "WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    new_24h = cur.fetchone()[0]
+def _buckets_result(row: tuple[Any, ...]) -> dict[str, Any]:
+    h24, d7, gt7d, unknown = row
+    return {
+        "available": True,
+        "last_seen_buckets": {"h24": h24, "d7": d7, "gt7d": gt7d, "unknown": unknown},
+    }
 
-    cur.execute(
-        "SELECT COUNT(*) FROM user_tiers "
-        "WHERE created_at > NOW() - INTERVAL '7 days'"
-    )
-    new_7d = cur.fetchone()[0]
 
-    return {"available": True, "total_users": total, "new_24h": new_24h, "new_7d": new_7d}
+def _fused(cur: Any, existing: set[str]) -> dict[str, dict[str, Any]] | None:
+    """counts, activity and last_seen_buckets in one statement.
 
+    Returns None when either table is missing; the caller then runs the
+    per-block builders, which report the missing table individually.
+    """
+    if not {"user_tiers", "user_sessions"} <= existing:
+        return None
 
-def _activity(cur: Any) -> dict[str, Any]:
-    """active_24h, active_7d from user_sessions."""
-    if not _table_exists(cur, "user_sessions"):
-        return _unavailable()
+    execute_prepared(cur, _SQL_FUSED_FROM_ROLLUP if "user_last_seen" in existing else _SQL_FUSED)
+    row = cur.fetchone()
+    return {
+        "counts": _counts_result(row[0:3]),
+        "activity": _activity_result(row[3:5]),
+        "last_seen_buckets": _buckets_result(row[5:9]),
+    }
 
-    cur.execute(
-        "SELECT COUNT(DISTINCT user_id) FROM user_sessions "
-        "WHERE last_event_at > NOW() - INTERVAL '24 hours'"
-    )
-    active_24h = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COUNT(DISTINCT user_id) FROM user_sessions "
-        "WHERE last_event_at > NOW() - INTERVAL '7 days'"
-    )
-    active_7d = cur.fetchone()[0]
+def _counts(cur: Any, existing: set[str]) -> dict[str, Any]:
+    """total_users, new_24h, new_7d."""
+    if "user_tiers" not in existing:
+        return unavailable()
+
+    execute_prepared(cur, _SQL_COUNTS)
+    return _counts_result(cur.fetchone())
 
-    return {"available": True, "active_24h": active_24h, "active_7d": active_7d}
 
+def _activity(cur: Any, existing: set[str]) -> dict[str, Any]:
+    """active_24h, active_7d from user_sessions."""
+    if "user_sessions" not in existing:
+        return unavailable()
 
-def _tiers(cur: Any) -> list[dict[str, Any]]:
-    """Tier distribution as [{tier, count}]."""
-    if not _table_exists(cur, "user_tiers"):
-        return []
+    execute_prepared(cur, _SQL_ACTIVITY)
+    return _activity_result(cur.fetchone())
 
-    cur.execute(
-        "SELECT COALESCE(tier, 'unknown'), COUNT(*) "
-        "FROM user_tiers GROUP BY tier ORDER BY COUNT(*) DESC"
-    )
-    return [{"tier": row[0], "count": row[1]} for row in cur.fetchall()]
 
+def _tiers(cur: Any, existing: set[str]) -> dict[str, Any]:
+    """Tier distribution as [{tier, count}], and whether it was sampled."""
+    if "user_tiers" not in existing:
+        return {"tiers": [], "tiers_sampled": False}
 
-def _last_seen_buckets(cur: Any) -> dict[str, Any]:
+    execute_prepared(cur, _SQL_TIERS)
+    tiers, sampled = cur.fetchone()
+    return {"tiers": tiers or [], "tiers_sampled": bool(sampled)}
+
+
+def _last_seen_buckets(cur: Any, existing: set[str]) -> dict[str, Any]:
     """Bucket users by last session activity: h24, d7, gt7d, unknown."""
-    if not _table_exists(cur, "user_tiers"):
-        return _unavailable()
+    if "user_tiers" not in existing:
+        return unavailable()
 
-    has_sessions = _table_exists(cur, "user_sessions")
+    has_rollup = "user_last_seen" in existing
+    has_sessions = has_rollup or "user_sessions" in existing
 
     if not has_sessions:
         # Without sessions we can only report total as unknown
-        cur.execute("SELECT COUNT(*) FROM user_tiers")
-        total = cur.fetchone()[0]
-        return {"available": True, "h24": 0, "d7": 0, "gt7d": 0, "unknown": total}
+        execute_prepared(cur, "SELECT COUNT(*) FROM user_tiers")
+        return _buckets_result((0, 0, 0, cur.fetchone()[0]))
 
-    # Left join user_tiers onto the latest session per user
-    cur.execute(
-        "SELECT "
-        "  SUM(CASE WHEN s.last_event_at > NOW() - INTERVAL '24 hours' THEN 1 ELSE 0 END), "
-        "  SUM(CASE WHEN s.last_event_at > NOW() - INTERVAL '7 days' "
-        "            AND s.last_event_at <= NOW() - INTERVAL '24 hours' THEN 1 ELSE 0 END), "
-        "  SUM(CASE WHEN s.last_event_at <= NOW() - INTERVAL '7 days' THEN 1 ELSE 0 END), "
-        "  SUM(CASE WHEN s.last_event_at IS NULL THEN 1 ELSE 0 END) "
-        "FROM user_tiers ut "
-        "LEFT JOIN LATERAL ("
-        "  SELECT MAX(last_event_at) AS last_event_at "
-        "  FROM user_sessions WHERE user_id = ut.user_id"
-        ") s ON TRUE"
-    )
-    row = cur.fetchone()
-    return {
-        "available": True,
-        "h24": int(row[0] or 0),
-        "d7": int(row[1] or 0),
-        "gt7d": int(row[2] or 0),
-        "unknown": int(row[3] or 0),
-    }
+    execute_prepared(cur, _SQL_BUCKETS_FROM_ROLLUP if has_rollup else _SQL_BUCKETS)
+    return _buckets_result(cur.fetchone())
 
 
-def _recent_users(cur: Any) -> list[dict[str, Any]]:
+def _recent_users(cur: Any, existing: set[str]) -> dict[str, Any]:
     """20 most recently created users with optional invite info."""
-    if not _table_exists(cur, "user_tiers"):
-        return []
+    if "user_tiers" not in existing:
+        return {"recent": []}
 
-    has_sessions = _table_exists(cur, "user_sessions")
-    has_redemptions = _table_exists(cur, "invite_redemptions")
-    has_invite_codes = _table_exists(cur, "invite_codes")
+    has_rollup = "user_last_seen" in existing
+    has_sessions = "user_sessions" in existing
+    has_redemptions = "invite_redemptions" in existing
+    has_invite_codes = "invite_codes" in existing
 
-    # Build the query dynamically based on available tables
+    # Build the query dynamically based on available tables.  The 20 users are
+    # picked first (top20) so every optional lookup is bounded to them.
     select = "SELECT ut.user_id, ut.tier, ut.created_at"
     joins = ""
-    order = "ORDER BY ut.created_at DESC LIMIT 20"
+    order = "ORDER BY ut.created_at DESC"
 
-    # Last seen from sessions
-    if has_sessions:
+    # Last seen from sessions.  Like the invite lookup below, this is an
+    # independent aggregate keyed by the top20 ids, hash-joined back.
+    if has_rollup:
+        select += ", ls.last_event_at"
+        joins += (
+            " LEFT JOIN ("
+            "  SELECT user_id, last_event_at FROM user_last_seen "
+            "  WHERE user_id IN (SELECT user_id FROM top20)"
+            ") ls ON ls.user_id = ut.user_id"
+        )
+    elif has_sessions:
         select += ", ls.last_event_at"
         joins += (
-            " LEFT JOIN LATERAL ("
-            "  SELECT MAX(last_event_at) AS last_event_at "
-            "  FROM user_sessions WHERE user_id = ut.user_id"
-            ") ls ON TRUE"
+            " LEFT JOIN ("
+            "  SELECT user_id, MAX(last_event_at) AS last_event_at "
+            "  FROM user_sessions "
+            "  WHERE user_id IN (SELECT user_id FROM top20) "
+            "  GROUP BY user_id"
+            ") ls ON ls.user_id = ut.user_id"
         )
     else:
         select += ", NULL AS last_event_at"
 
-    # Invite info from redemptions + codes
+    # Invite info from redemptions + codes: each user's first redemption, in
+    # one ordered pass over the top20 users' rows rather than a sort per user.
     if has_redemptions:
         select += ", ir.code AS invite_code"
         joins += (
-            " LEFT JOIN LATERAL ("
-            "  SELECT code FROM invite_redemptions "
-            "  WHERE user_id = ut.user_id ORDER BY redeemed_at LIMIT 1"
-            ") ir ON TRUE"
+            " LEFT JOIN ("
+            "  SELECT DISTINCT ON (user_id) user_id, code FROM invite_redemptions "
+            "  WHERE user_id IN (SELECT user_id FROM top20) "
+            "  ORDER BY user_id, redeemed_at"
+            ") ir ON ir.user_id = ut.user_id"
         )
     else:
         select += ", NULL AS invite_code"
@@ -175,100 +258,129 @@ def _recent_users(cur: Any) -> list[dict[str, Any]]:
     else:
         select += ", NULL AS invite_source"
 
-    query = f"{select} FROM user_tiers ut{joins} {order}"
-    cur.execute(query)
-    rows = cur.fetchall()
+    query = (
+        "WITH top20 AS ("
+        "  SELECT user_id, tier, created_at FROM user_tiers "
+        "  ORDER BY created_at DESC LIMIT 20"
+        f") {select} FROM top20 ut{joins} {order}"
+    )
+    # At most a handful of variants (one per combination of optional tables);
+    # each is prepared lazily under its own digest-derived name.
+    execute_prepared(cur, query)
 
     result = []
-    for row in rows:
+    for user_id, tier, created_at, last_seen_at, invite_code, invite_source in cur:
         entry: dict[str, Any] = {
-            "user_id": row[0],
-            "tier": row[1],
-            "created_at": _iso(row[2]),
-            "last_seen_at": _iso(row[3]),
+            "user_id": user_id,
+            "tier": tier,
+            "created_at": created_at,
+            "last_seen_at": last_seen_at,
         }
-        if row[4] is not None:
-            entry["invite_code"] = row[4]
-        if row[5] is not None:
-            entry["invite_source"] = row[5]
+        if invite_code is not None:
+            entry["invite_code"] = invite_code
+        if invite_source is not None:
+            entry["invite_source"] = invite_source
         result.append(entry)
 
-    return result
+    return {"recent": result}
 
 
 # -- Main builder -----------------------------------------------------------
 
-def build_telemetry_users() -> dict[str, Any]:
-    """Build the users telemetry payload. Each sub-block is fault-tolerant."""
-    now = datetime.now(timezone.utc).isoformat()
-    users: dict[str, Any] = {}
-    errors: list[str] = []
-
-    with get_conn() as conn:
+def _run_block(fn: Callable[[Any, set[str]], Any]) -> Any:
+    """Run one sub-block on its own pooled, read-only connection."""
+    with CONN_SLOTS, get_conn() as conn:
+        conn.set_session(readonly=True)
         with conn.cursor() as cur:
-            # Counts: total_users, new_24h, new_7d
             try:
-                counts = _counts(cur)
-                if counts.get("available"):
-                    users["total_users"] = counts["total_users"]
-                    users["new_24h"] = counts["new_24h"]
-                    users["new_7d"] = counts["new_7d"]
-                else:
-                    users["total_users"] = None
-                    users["new_24h"] = None
-                    users["new_7d"] = None
-                    errors.append(f"counts: {counts.get('reason', 'unavailable')}")
+                return fn(cur, existing_tables(cur, _TABLES))
             except Exception as exc:
-                users["total_users"] = None
-                users["new_24h"] = None
-                users["new_7d"] = None
-                errors.append(f"counts: {type(exc).__name__}")
-
-            # Activity: active_24h, active_7d
-            try:
-                activity = _activity(cur)
-                if activity.get("available"):
-                    users["active_24h"] = activity["active_24h"]
-                    users["active_7d"] = activity["active_7d"]
-                else:
-                    users["active_24h"] = None
-                    users["active_7d"] = None
-                    errors.append(f"activity: {activity.get('reason', 'unavailable')}")
-            except Exception as exc:
-                users["active_24h"] = None
-                users["active_7d"] = None
-                errors.append(f"activity: {type(exc).__name__}")
+                invalidate_on_missing_table(exc)
+                raise
+
+
+# Per-block fallbacks for the fused counts/activity/buckets statement.
+_FUSED_BLOCKS = {
+    "counts": _counts,
+    "activity": _activity,
+    "last_seen_buckets": _last_seen_buckets,
+}
+
+# Payload order: block name -> the keys it fills, with the values used when
+# the block is unavailable or fails.
+_BLOCKS: list[tuple[str, dict[str, Any]]] = [
+    ("counts", {"total_users": None, "new_24h": None, "new_7d": None}),
+    ("activity", {"active_24h": None, "active_7d": None}),
+    ("tiers", {"tiers": [], "tiers_sampled": False}),
+    ("last_seen_buckets", {"last_seen_buckets": None}),
+    ("recent", {"recent": []}),
+]
+
+# Shared across requests; worker threads are started on first use and reused.
+# Connections are bounded separately, by the CONN_SLOTS semaphore that all
+# telemetry executors share.
+_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="telemetry-users")
+
+
+def _merge_block(
+    users: dict[str, Any],
+    errors: list[str],
+    name: str,
+    defaults: dict[str, Any],
+    get: Callable[[], dict[str, Any]],
+) -> None:
+    """Copy one block's keys into *users*, or its defaults plus an error."""
+    try:
+        block = get()
+    except Exception as exc:
+        users.update(deepcopy(defaults))
+        errors.append(f"{name}: {type(exc).__name__}")
+        return
+    if block.get("available", True):
+        for key in defaults:
+            users[key] = block[key]
+    else:
+        users.update(deepcopy(defaults))
+        errors.append(f"{name}: {block.get('reason', 'unavailable')}")
 
-            # Tiers
-            try:
-                users["tiers"] = _tiers(cur)
-            except Exception as exc:
-                users["tiers"] = []
-                errors.append(f"tiers: {type(exc).__name__}")
 
-            # Last-seen buckets
-            try:
-                buckets = _last_seen_buckets(cur)
-                if buckets.get("available"):
-                    users["last_seen_buckets"] = {
-                        "h24": buckets["h24"],
-                        "d7": buckets["d7"],
-                        "gt7d": buckets["gt7d"],
-                        "unknown": buckets["unknown"],
-                    }
-                else:
-                    users["last_seen_buckets"] = None
-                    errors.append(f"last_seen_buckets: {buckets.get('reason', 'unavailable')}")
-            except Exception as exc:
-                users["last_seen_buckets"] = None
-                errors.append(f"last_seen_buckets: {type(exc).__name__}")
+@ttl_cache(seconds=30)
+def build_telemetry_users() -> dict[str, Any]:
+    """Build the users telemetry payload. Each sub-block is fault-tolerant."""
+    now = now_iso()
+    users: dict[str, Any] = {}
+    errors: list[str] = []
 
-            # Recent users
-            try:
-                users["recent"] = _recent_users(cur)
-            except Exception as exc:
-                users["recent"] = []
-                errors.append(f"recent: {type(exc).__name__}")
+    # Sub-blocks are independent, so each runs concurrently on its own pooled
+    # connection; wall time is the slowest block rather than the sum, and a
+    # failing block cannot abort the others' transaction.
+    fused_future = _EXECUTOR.submit(_run_block, _fused)
+    tiers_future = _EXECUTOR.submit(_run_block, _tiers)
+    recent_future = _EXECUTOR.submit(_run_block, _recent_users)
+
+    # counts/activity/buckets in one round trip; if the fused statement fails
+    # (or a table is missing), each block runs on its own and reports its own
+    # error.
+    fused: dict[str, dict[str, Any]] | None = None
+    try:
+        fused = fused_future.result()
+    except Exception:
+        pass
+    if fused is None:
+        fallback = {name: _EXECUTOR.submit(_run_block, fn) for name, fn in _FUSED_BLOCKS.items()}
+
+    def _core(name: str) -> dict[str, Any]:
+        return fused[name] if fused else fallback[name].result()
+
+    sources: dict[str, Callable[[], dict[str, Any]]] = {
+        "counts": partial(_core, "counts"),
+        "activity": partial(_core, "activity"),
+        "tiers": tiers_future.result,
+        "last_seen_buckets": partial(_core, "last_seen_buckets"),
+        "recent": recent_future.result,
+    }
+    for name, defaults in _BLOCKS:
+        _merge_block(users, errors, name, defaults, sources[name])
 
     result: dict[str, Any] = {
         "ok": True,
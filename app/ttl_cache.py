@@ -0,0 +1,52 @@
+"""Process-local TTL memoization for expensive payload builders.
+
+Admin dashboards poll the same builders every few seconds from several tabs;
+a short TTL collapses those polls into one DB pass without visible staleness.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def ttl_cache(seconds: float) -> Callable[[F], F]:
+    """Memoize a function's result per positional-args tuple for *seconds*.
+
+    Concurrent misses for the same function are serialized, so a burst of
+    polls triggers a single rebuild.  Exceptions are not cached.  Cached
+    results are shared: callers must treat them as read-only.
+
+    ``fn.refresh(*args)`` bypasses a fresh entry, rebuilds and re-caches it.
+    """
+
+    def decorator(fn: F) -> F:
+        entries: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        def _rebuild(args: tuple[Any, ...]) -> Any:
+            value = fn(*args)
+            entries[args] = (time.monotonic() + seconds, value)
+            return value
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any) -> Any:
+            with lock:
+                hit = entries.get(args)
+                if hit is not None and hit[0] > time.monotonic():
+                    return hit[1]
+                return _rebuild(args)
+
+        def refresh(*args: Any) -> Any:
+            with lock:
+                return _rebuild(args)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        wrapper.refresh = refresh  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator